@@ -1,22 +1,72 @@
 # nuvom/cli/cli.py
 
+import atexit
+import os
+import sys
 import typer
-import threading
-import time
-from pathlib import Path
 from rich.console import Console
 
-from nuvom import __version__
-from nuvom.config import get_settings
-from nuvom.worker import start_worker_pool
-from nuvom.result_store import get_result, get_error
-from nuvom.cli.commands import discover_tasks, list_tasks, inspect_job, history, runtestworker, plugin
-from nuvom.log import get_logger
-
-logger = get_logger()
+from nuvom.cli.lazy import EAGER_ENV_VAR, LazySubcommand, eager_imports_enabled, lazy_group
 
 console = Console()
+
+#  ------ startup profiling ------------------------------------------------
+# NUVOM_STARTUP_PROFILE=<file> dumps the names of every module imported by the
+# process (as a JSON list) when it exits. Used by the startup regression tests
+# and handy for spotting an accidental eager import.
+_STARTUP_PROFILE = os.environ.get("NUVOM_STARTUP_PROFILE")
+
+
+def _dump_loaded_modules(path: str) -> None:
+    import json
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sorted(sys.modules), f)
+
+
+if _STARTUP_PROFILE:
+    atexit.register(_dump_loaded_modules, _STARTUP_PROFILE)
+
+#  ------ sub-apps (imported only when invoked) -----------------------------
+SUBCOMMANDS = (
+    LazySubcommand(
+        "discover",
+        "nuvom.cli.commands.discover_tasks:discover_app",
+        help="Recursively scan for @task functions and refresh .nuvom/manifest.json",
+        rich_help_panel="🌟  Core Commands",
+    ),
+    LazySubcommand(
+        "list",
+        "nuvom.cli.commands.list_tasks:list_app",
+        help="List tasks discovered in the manifest and registered at runtime.",
+        rich_help_panel="🌟  Core Commands",
+    ),
+    LazySubcommand(
+        "inspect",
+        "nuvom.cli.commands.inspect_job:inspect_app",
+        help="Inspect stored job metadata.",
+    ),
+    LazySubcommand(
+        "history",
+        "nuvom.cli.commands.history:history_app",
+        help="Show recent jobs (reads backend metadata).",
+    ),
+    LazySubcommand(
+        "runtestworker",
+        "nuvom.cli.commands.runtestworker:runtest_app",
+        help="Run a single job JSON synchronously (ideal for CI).",
+        rich_help_panel="⚙  Dev Tools",
+    ),
+    LazySubcommand(
+        "plugin",
+        "nuvom.cli.commands.plugin:plugin_app",
+        help="Manage Nuvom plugins (status, scaffold, test).",
+        rich_help_panel="🔌 Plugins",
+    ),
+)
+
 app = typer.Typer(
+    cls=lazy_group(*SUBCOMMANDS),
     add_completion=False,
     help=(
         "Nuvom – lightweight, plugin-first task-queue.\n\n"
@@ -32,15 +82,21 @@ app = typer.Typer(
 @app.command(rich_help_panel="📦  Misc")
 def version():
     """Show current Nuvom version."""
+    from nuvom import __version__
+
     console.print(f"[bold green]NUVOM v{__version__}[/bold green]")
 
 @app.command(rich_help_panel="📦  Misc")
 def config():
     """Print current settings loaded from .env / env vars."""
+    from nuvom.config import get_settings
+
     settings = get_settings()
     console.print("[bold green]Nuvom Configuration:[/bold green]")
     for key, val in settings.summary().items():
         console.print(f"[cyan]{key}[/cyan] = {val}")
+    mode = "eager" if eager_imports_enabled() else "lazy"
+    console.print(f"[cyan]cli_imports[/cyan] = {mode} (set {EAGER_ENV_VAR}=1 for eager)")
 
 @app.command(rich_help_panel="🌟  Core Commands")
 def runworker(
@@ -51,16 +107,21 @@ def runworker(
         )
     ):
     """Start worker pool in the foreground."""
-    
+    from nuvom.log import get_logger
+    from nuvom.worker import start_worker_pool
+
+    logger = get_logger()
     console.print("[yellow]🚀 Starting worker...[/yellow]")
     logger.info("Starting worker pool with dev=%s", dev)
 
-    observer = None
+    observer = handler = None
     if dev:
+        from nuvom.discovery.manifest import ManifestManager
         from nuvom.watcher import ManifestChangeHandler
         from watchdog.observers import Observer
 
-        manifest_path = Path(".nuvom/manifest.json").resolve()
+        # Same file the reloader reads; resolved once, only in dev mode.
+        manifest_path = ManifestManager.DEFAULT_PATH.resolve()
         handler = ManifestChangeHandler(manifest_path)
         observer = Observer()
         observer.schedule(handler, manifest_path.parent, recursive=False)
@@ -74,6 +135,7 @@ def runworker(
         if observer:
             observer.stop()
             observer.join()
+            handler.cancel()
             logger.debug("Manifest watcher stopped")
             
  
@@ -105,8 +167,11 @@ def runscheduler(
         nuvom runscheduler
         nuvom runscheduler --poll 2.0 --batch 50 --jitter 0.5
     """
+    from nuvom.log import get_logger
     from nuvom.scheduler.worker import SchedulerWorker
 
+    logger = get_logger()
+
     console.print("[yellow]⏳ Starting scheduler worker...[/yellow]")
     logger.info(
         "Starting scheduler worker (poll=%.3fs, batch=%d, jitter=%.3fs)",
@@ -136,28 +201,24 @@ def status(job_id: str):
     Example:
         nuvom status a1b2c3d4
     """
-    error = get_error(job_id)
-    if error:
-        console.print(f"[bold red]❌ FAILED:[/bold red] {error}")
-        logger.warning("Job %s failed: %s", job_id, error)
+    from nuvom.log import get_logger
+    from nuvom.result_store import get_outcome
+
+    logger = get_logger()
+    state, value = get_outcome(job_id)
+
+    if state == "FAILED":
+        console.print(f"[bold red]❌ FAILED:[/bold red] {value}")
+        logger.warning("Job %s failed: %s", job_id, value)
         return
 
-    result = get_result(job_id)
-    if result is not None:
-        console.print(f"[bold green]✅ SUCCESS:[/bold green] {result}")
-        logger.info("Job %s succeeded: %s", job_id, result)
+    if state == "SUCCESS":
+        console.print(f"[bold green]✅ SUCCESS:[/bold green] {value}")
+        logger.info("Job %s succeeded: %s", job_id, value)
         return
 
     console.print("[cyan]🕒 PENDING[/cyan]")
     logger.info("Job %s is pending", job_id)
 
-#  ------ sub-apps (now displayed under dedicated help panels) --------------
-app.add_typer(discover_tasks.discover_app,  name="discover",)
-app.add_typer(list_tasks.list_app,          name="list",    )
-app.add_typer(inspect_job.inspect_app,      name="inspect", )
-app.add_typer(history.history_app,          name="history", )
-app.add_typer(runtestworker.runtest_app,    name="runtestworker", rich_help_panel="⚙  Dev Tools")
-app.add_typer(plugin.plugin_app,            name="plugin",        rich_help_panel="🔌 Plugins")
-
 def main():
     app()
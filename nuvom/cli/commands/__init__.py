@@ -0,0 +1,25 @@
+# nuvom/cli/commands/__init__.py
+
+"""
+CLI sub-command modules.
+
+Submodules are resolved on attribute access (PEP 562) so that importing this
+package does not pull in every command's dependencies.
+"""
+
+import importlib
+
+__all__ = [
+    "discover_tasks",
+    "history",
+    "inspect_job",
+    "list_tasks",
+    "plugin",
+    "runtestworker",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
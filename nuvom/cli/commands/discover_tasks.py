@@ -7,12 +7,10 @@ and update the manifest file.
 import typer
 from typing import List
 from rich.console import Console
-from rich.table import Table
 from pathlib import Path
 
-from nuvom.discovery.discover_tasks import discover_tasks
+from nuvom.discovery.discover_tasks import DEFAULT_PARSE_CACHE_PATH, iter_tasks
 from nuvom.discovery.manifest import ManifestManager
-from nuvom.discovery.reference import TaskReference
 from nuvom.log import get_logger
 
 console = Console()
@@ -25,6 +23,7 @@ discover_app = typer.Typer(
         "Examples:\n"
         "  nuvom discover tasks                    # default scan\n"
         "  nuvom discover tasks --include 'app/**' --exclude 'tests/**'\n"
+        "  nuvom discover tasks --no-cache         # re-parse every file\n"
     ),
     rich_help_panel="🌟  Core Commands",
 )
@@ -35,6 +34,12 @@ def discover_tasks_cli(
     root: str = ".",
     include: List[str] = typer.Option([], help="Glob patterns to include"),
     exclude: List[str] = typer.Option([], help="Glob patterns to exclude"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore and don't update the parse cache in .nuvom/"
+    ),
+    jobs: int = typer.Option(
+        0, "--jobs", "-j", min=0, help="Parser processes for large trees (0 = CPU count, 1 = serial)"
+    ),
 ):
     """Discover @task definitions and update the manifest file."""
     root_path = Path(root).resolve()
@@ -46,32 +51,46 @@ def discover_tasks_cli(
         exclude,
     )
 
-    all_refs: List[TaskReference] = discover_tasks(
-        root_path=root, include=include, exclude=exclude
+    # Discovery is streamed straight into the diff; nothing else holds the refs.
+    manager = ManifestManager()
+    diff = manager.diff_and_save(
+        iter_tasks(
+            root_path=root,
+            include=include,
+            exclude=exclude,
+            cache_path=None if no_cache else DEFAULT_PARSE_CACHE_PATH,
+            jobs=jobs or None,
+        )
     )
-    console.print(f"[cyan]🔎 Found {len(all_refs)} task(s).[/cyan]")
+    console.print(f"[cyan]🔎 Found {diff['total']} task(s).[/cyan]")
+
+    _render_changes(diff)
 
-    manager = ManifestManager()
-    diff = manager.diff_and_save(all_refs)
+
+def _render_changes(diff: dict) -> None:
+    """Print the manifest diff as a table; the no-change path builds nothing."""
+    added, removed, modified = diff["added"], diff["removed"], diff["modified"]
+    if not (added or removed or modified):
+        console.print("[dim]No manifest changes detected.[/dim]")
+        return
+
+    from rich.table import Table
 
     table = Table(title="Manifest Changes", show_lines=True)
     table.add_column("Type", style="bold magenta")
     table.add_column("Task", style="yellow")
 
-    for t in diff["added"]:
+    for t in added:
         table.add_row("[green]+ Added[/green]", str(t))
-    for t in diff["removed"]:
+    for t in removed:
         table.add_row("[red]- Removed[/red]", str(t))
-    for t in diff["modified"]:
+    for t in modified:
         table.add_row("[blue]~ Modified[/blue]", str(t))
 
-    if not (diff["added"] or diff["removed"] or diff["modified"]):
-        console.print("[dim]No manifest changes detected.[/dim]")
-    else:
-        console.print(table)
-        logger.info(
-            "✅ Manifest updated with %d additions, %d removals, %d modifications",
-            len(diff["added"]),
-            len(diff["removed"]),
-            len(diff["modified"]),
-        )
+    console.print(table)
+    logger.info(
+        "✅ Manifest updated with %d additions, %d removals, %d modifications",
+        len(added),
+        len(removed),
+        len(modified),
+    )
@@ -1,8 +1,10 @@
+import contextlib
+import heapq
+import inspect
 import typer
-from rich.table import Table
-from rich.console import Console
 from typing import Optional
 
+from nuvom.log import log_to_stderr
 from nuvom.result_store import get_backend
 
 history_app = typer.Typer(
@@ -12,11 +14,11 @@ history_app = typer.Typer(
         "Examples:\n"
         "  nuvom history recent --limit 20\n"
         "  nuvom history recent --status FAILED\n"
+        "  nuvom history recent --limit 5000 --compact\n"
+        "  nuvom history recent --json > jobs.json\n"
     ),
 )
 
-console = Console()
-
 
 @history_app.command("recent")
 def show_recent(
@@ -28,49 +30,106 @@ def show_recent(
         help="Filter by status: SUCCESS | FAILED | PENDING",
         case_sensitive=False,
         ),
+    compact: bool = typer.Option(
+        False,
+        "--compact",
+        help="Borderless table; much faster for large histories.",
+        ),
+    as_json: bool = typer.Option(
+        False,
+        "--json",
+        help="Emit the raw job records as JSON (for scripts).",
+        ),
     ):
     """Pretty table of recent jobs (newest first)."""
-    
-    backend = get_backend()
+    from rich.console import Console
 
-    if not hasattr(backend, "list_jobs"):
-        console.print("[red]⚠️ This backend does not support job history.[/red]")
-        raise typer.Exit(1)
-
-    jobs = backend.list_jobs()
+    console = Console()
 
     if status:
         status = status.upper()
-        jobs = [j for j in jobs if j.get("status") == status]
 
-    jobs = sorted(jobs, key=lambda j: j.get("created_at", 0), reverse=True)
+    # With --json, stdout must hold only the payload (`> jobs.json`), so any
+    # log lines emitted while resolving the backend go to stderr instead.
+    with log_to_stderr() if as_json else contextlib.nullcontext():
+        backend = get_backend()
+
+        if not hasattr(backend, "list_jobs"):
+            console.print("[red]⚠️ This backend does not support job history.[/red]")
+            raise typer.Exit(1)
 
+        if _accepts_filters(backend.list_jobs):
+            jobs = backend.list_jobs(status=status, limit=limit)
+        else:
+            # Third-party backend with the pre-filtering `list_jobs()` signature.
+            jobs = backend.list_jobs()
+            if status:
+                jobs = [j for j in jobs if j.get("status") == status]
+
+    # Newest first; with a limit only the top-k need ordering – O(N log k).
     if limit:
-        jobs = jobs[:limit]
+        jobs = heapq.nlargest(limit, jobs, key=_created_at)
+    else:
+        jobs = sorted(jobs, key=_created_at, reverse=True)
 
-    table = Table(title="Nuvom Job History")
-    table.add_column("Job ID", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Task", style="green")
-    table.add_column("result", style="green")
-    table.add_column("error", style="red")
-    table.add_column("args", style="yellow")
-    table.add_column("Created", style="dim")
-    table.add_column("Completed", style="dim")
+    if as_json:
+        # Machine output: one encode, no rich markup or highlighting.
+        from nuvom.utils.compat_utils.json_compat import dumps
+
+        console.out(dumps(jobs, default=str).decode("utf-8"), highlight=False)
+        return
+
+    if not jobs:
+        console.print("[yellow]No job history found.[/yellow]")
+        return
 
-    for job in jobs:
-        table.add_row(
+    rows = [
+        (
             job.get("job_id", "N/A"),
             job.get("status", "N/A"),
             job.get("func_name", "N/A"),
-            str(job.get("result", "N/A")), #int is Not Renderable; a string or other renderable object is required
+            str(job.get("result", "N/A")),  # int is not renderable; rich needs a str
             job.get("error", "N/A"),
-            str(job.get("args", "N/A")), #list is Not Renderable; a string or other renderable object is required
+            str(job.get("args", "N/A")),  # list is not renderable; rich needs a str
             f"{job.get('created_at', 0)}",
             f"{job.get('completed_at', 0)}",
         )
+        for job in jobs
+    ]
 
-    if not jobs:
-        console.print("[yellow]No job history found.[/yellow]")
+    from rich.table import Table
+
+    if compact:
+        # Box drawing dominates render time on thousands of rows.
+        table = Table(title="Nuvom Job History", box=None, pad_edge=False, show_lines=False)
     else:
-        console.print(table)
+        table = Table(title="Nuvom Job History")
+    table.add_column("Job ID", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Task", style="green")
+    table.add_column("result", style="green")
+    table.add_column("error", style="red")
+    table.add_column("args", style="yellow")
+    table.add_column("Created", style="dim")
+    table.add_column("Completed", style="dim")
+
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
+
+
+def _accepts_filters(list_jobs) -> bool:
+    """True if `list_jobs` takes the `status` and `limit` keyword arguments."""
+    try:
+        params = inspect.signature(list_jobs).parameters
+    except (TypeError, ValueError):  # no introspectable signature
+        return False
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return True
+    return "status" in params and "limit" in params
+
+
+def _created_at(job: dict) -> float:
+    """Sort key for job records; missing timestamps sort last."""
+    return job.get("created_at") or 0
@@ -8,17 +8,14 @@ Supported output formats:
     • raw
 """
 
-import json
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.syntax import Syntax
-from rich.table import Table
 
-from nuvom.result_store import get_backend
+from nuvom.result_store import get_full
 from nuvom.serialize import deserialize
 from nuvom.log import get_logger
+from nuvom.utils.compat_utils.json_compat import dumps_pretty
 
 logger = get_logger()
 
@@ -33,7 +30,24 @@ inspect_app = typer.Typer(
         ),
     )
 
-console = Console()
+# Rows shown by the table view, in display order.
+_INSPECT_FIELDS = (
+    "job_id",
+    "status",
+    "func_name",
+    "args",
+    "kwargs",
+    "result",
+    "error",
+    "retries_left",
+    "attempts",
+    "timeout_policy",
+    "created_at",
+    "completed_at",
+)
+
+# Exact-type dispatch: backends decode to plain dict/list, never subclasses.
+_JSON_TYPES = frozenset((dict, list))
 
 @inspect_app.command("job")
 def inspect_job(
@@ -49,21 +63,23 @@ def inspect_job(
     """
     Inspect the stored metadata for a finished job.
     """
-    backend = get_backend()
-    metadata = getattr(backend, "get_full", lambda _id: None)(job_id)
+    from rich.console import Console
+
+    console = Console()
+    metadata = get_full(job_id)
 
     if not metadata:
         console.print(f"[bold red]❌ No metadata found for job:[/bold red] {job_id}")
         raise typer.Exit(code=1)
 
     if format == "json":
-        console.print_json(data=metadata)
+        _print_json(console, metadata)
 
     elif format == "raw":
-        _render_raw(metadata)
+        _render_raw(console, metadata)
 
     elif format == "table":
-        _render_table(metadata)
+        _render_table(console, metadata)
 
     else:
         console.print(f"[red]Invalid format:[/red] {format}")
@@ -71,7 +87,7 @@ def inspect_job(
 
     logger.debug("Inspected job %s with format='%s'", job_id, format)
 
-def _render_table(data: dict):
+def _render_table(console, data: dict):
     """
     Render job metadata in a Rich table. If an error has a traceback,
     display it as a syntax-highlighted block below the table.
@@ -82,36 +98,27 @@ def _render_table(data: dict):
         except Exception:
             pass
 
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Field", style="bold")
     table.add_column("Value")
 
-    for key in [
-        "job_id",
-        "status",
-        "func_name",
-        "args",
-        "kwargs",
-        "result",
-        "error",
-        "retries_left",
-        "attempts",
-        "timeout_policy",
-        "created_at",
-        "completed_at",
-    ]:
+    for key in _INSPECT_FIELDS:
         value = data.get(key)
         if key == "error" and value and isinstance(value, dict):
             # Show panel after table
             error_trace = value.get("traceback", "").strip()
             if error_trace:
+                from rich.syntax import Syntax
+
                 table.add_row("error", value.get("message", ""))
                 console.print(table)
                 console.rule("[red]Traceback[/red]")
                 console.print(Syntax(error_trace, "python", theme="monokai", line_numbers=True))
                 return
-        elif isinstance(value, (dict, list)):
-            value = json.dumps(value, indent=2)
+        elif type(value) in _JSON_TYPES:
+            value = dumps_pretty(value)
         else:
             value = str(value)
 
@@ -119,17 +126,32 @@ def _render_table(data: dict):
 
     console.print(table)
 
-def _render_raw(data: dict):
+def _render_raw(console, data: dict):
     """
     Raw mode:
     1. Pretty-print complete JSON metadata.
     2. If an error traceback exists, display it in a Rich syntax block.
     """
     console.rule("[bold green]Job Metadata (raw)[/bold green]")
-    console.print_json(data=data)
+    _print_json(console, data)
 
     err = data.get("error") or {}
     tb = (err.get("traceback") or "").strip()
     if tb:
+        from rich.syntax import Syntax
+
         console.rule("[bold red]Traceback (raw)[/bold red]")
         console.print(Syntax(tb, "python", theme="monokai", line_numbers=True))
+
+def _print_json(console, data: dict):
+    """
+    Serialize once and print. Highlighting is only applied on a terminal;
+    piped output gets the plain JSON text.
+    """
+    raw = dumps_pretty(data, default=str)
+    if console.is_terminal:
+        from rich.syntax import Syntax
+
+        console.print(Syntax(raw, "json", theme="monokai", word_wrap=True))
+    else:
+        console.out(raw, highlight=False)
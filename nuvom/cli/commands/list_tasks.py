@@ -4,15 +4,11 @@ List registered @task definitions and their metadata.
 """
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from nuvom.discovery.manifest import ManifestManager
-from nuvom.registry.registry import get_task_registry, TaskInfo
-from nuvom.log import get_logger
+from nuvom.registry.registry import get_task_registry
 
-console = Console()
-logger = get_logger()
+_NO_METADATA: dict = {}
 
 list_app = typer.Typer(
     name="list",
@@ -29,12 +25,26 @@ list_app = typer.Typer(
 @list_app.command("tasks")
 def list_tasks():
     """Render a table of all @task definitions with metadata columns."""
-    manifest = ManifestManager()
-    discovered_tasks = manifest.load()
-    registry = get_task_registry()
+    from rich.console import Console
+    from nuvom.log import get_logger
+
+    logger = get_logger()
+    console = Console()
+    # ManifestManager.load() is memoized on the manifest's (mtime, size), so
+    # repeated invocations in one process skip the read + parse.
+    discovered_tasks = ManifestManager().load()
 
     logger.debug("Loaded %d tasks from manifest", len(discovered_tasks))
 
+    if not discovered_tasks:
+        console.print("[yellow]No task definitions found.[/yellow]")
+        return
+
+    from rich.table import Table
+
+    # Direct per-name lookup; `registry.all()` would copy the whole registry.
+    get_metadata = get_task_registry().get_metadata
+
     table = Table(title="Registered Tasks", show_lines=True)
     table.add_column("Name", style="yellow")
     table.add_column("Module", style="blue")
@@ -42,15 +52,17 @@ def list_tasks():
     table.add_column("Tags", style="green")
     table.add_column("Description", style="white")
 
+    add_row = table.add_row
     for task in discovered_tasks:
-        task_info: TaskInfo = registry.all().get(task.func_name)
-        metadata = task_info.metadata if task_info else {}
-        tags = ", ".join(metadata.get("tags", []))
-        description = metadata.get("description", "")
-        table.add_row(task.func_name, task.module_name, task.file_path, tags, description)
+        md_get = (get_metadata(task.func_name) or _NO_METADATA).get
+        tags = md_get("tags")
+        add_row(
+            task.func_name,
+            task.module_name,
+            task.file_path,
+            ", ".join(tags) if tags else "",
+            md_get("description", ""),
+        )
 
-    if not discovered_tasks:
-        console.print("[yellow]No task definitions found.[/yellow]")
-    else:
-        console.print(table)
-        logger.info("Listed %d tasks", len(discovered_tasks))
+    console.print(table)
+    logger.info("Listed %d tasks", len(discovered_tasks))
@@ -6,13 +6,12 @@ Currently only implements **status**; scaffold/test will be added next.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 import typer
-from rich.table import Table
-from rich.console import Console
 from datetime import datetime
-import importlib.util
-import traceback
+import importlib
 
 from nuvom.plugins.loader import load_plugins
 from nuvom.plugins.registry import REGISTRY, ensure_builtins_registered
@@ -30,7 +29,69 @@ plugin_app = typer.Typer(
     ),
     rich_help_panel="🔌 Plugin System",
 )
-console = Console()
+
+# Lifecycle methods every plugin must implement (checked by `plugin test`)
+_PLUGIN_HOOKS = ("start", "stop")
+
+# Source written by `plugin scaffold`; filled with str.format.
+_PLUGIN_STUB_TEMPLATE = '''\
+from nuvom.plugins.contracts import Plugin
+
+class {class_name}(Plugin):
+    api_version = "1.0"
+    name = "{name}"
+    provides = ["{capability}"]      # "queue_backend", "result_backend", or other
+    requires = []                    # List dependencies this plugin needs
+
+    def start(self, settings: dict) -> None:
+        # Initialize plugin (e.g. connect to service, configure hooks)
+        pass
+
+    def stop(self) -> None:
+        # Cleanup plugin resources
+        pass
+'''
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console_instance: Optional["Console"] = None
+
+
+def _console() -> "Console":
+    """Shared rich Console, created on first use so imports stay cheap."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
+
+
+@lru_cache(maxsize=256)
+def _snake_to_pascal(name: str) -> str:
+    """Turn a plugin name like ``my_sqs_backend`` into ``MySqsBackend``."""
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def _find_plugin_class(module) -> Optional[type]:
+    """
+    Return the Plugin subclass defined in `module`, if any.
+
+    Direct subclasses are found through `Plugin.__subclasses__()` instead of
+    reflecting over every module attribute. A class only counts if the module
+    still exposes it, which skips stale classes from an earlier load under the
+    same module name. Indirect subclasses fall back to the attribute scan.
+    """
+    for cls in Plugin.__subclasses__():
+        if cls.__module__ == module.__name__ and getattr(module, cls.__name__, None) is cls:
+            return cls
+
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin:
+            return attr
+    return None
 
 
 @plugin_app.command("status")
@@ -38,7 +99,9 @@ def status() -> None:
     """
     Display all plugins that are registered / loaded in the current process.
     """
-    
+    from rich.table import Table
+
+    console = _console()
     ensure_builtins_registered()
     load_plugins()                           # ensure everything is imported
 
@@ -48,17 +111,24 @@ def status() -> None:
     table.add_column("Provider")
     table.add_column("Loaded At")
 
-    now = datetime.now().strftime("%H:%M:%S")
+    dt = datetime.now()
+    now = f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"  # no locale-aware strftime
+
+    # Flatten the registry once into complete rows; `type(obj)` is what
+    # `obj.__class__` resolves to. Rows go in through the public `add_row` –
+    # it is cheap next to rendering, so rich's private row storage stays untouched.
+    rows = [
+        (cap, name, type(obj).__name__, now)
+        for cap, bucket in REGISTRY._caps.items()            # type: ignore[attr-defined]
+        for name, obj in bucket.items()
+    ]
 
-    for cap, bucket in REGISTRY._caps.items():               # type: ignore[attr-defined]
-        for name, obj in bucket.items():
-            provider = getattr(obj, "__class__", type(obj)).__name__
-            table.add_row(cap, name, provider, now)
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
-    if REGISTRY._caps:                                   # type: ignore[attr-defined]
-        console.print(table)
-    else:
-        console.print(table)
+    console.print(table)
+    if not rows:
         console.print("[yellow]No plugins loaded.[/yellow]")
 
 
@@ -73,39 +143,25 @@ def scaffold(
     """
     Scaffold a new plugin stub that implements the Plugin protocol.
     """
+    console = _console()
     if not name.isidentifier():
         console.print(f"[red]❌ Invalid plugin name: {name}[/red]")
         raise typer.Exit(code=1)
 
-    class_name = "".join(part.capitalize() for part in name.split("_"))
+    class_name = _snake_to_pascal(name)
     filename = out / f"{name}.py"
 
     if filename.exists() and not force:
         console.print(f"[yellow]⚠ File {filename} already exists. Use --force to overwrite.[/yellow]")
         raise typer.Exit(code=1)
 
-    plugin_stub = f'''\
-
-from nuvom.plugins.contracts import Plugin
-
-class {class_name}(Plugin):
-    api_version = "1.0"
-    name = "{name}"
-    provides = ["{capability}"]      # "queue_backend", "result_backend", or other
-    requires = []                    # List dependencies this plugin needs
-
-    def start(self, settings: dict) -> None:
-        # Initialize plugin (e.g. connect to service, configure hooks)
-        pass
-
-    def stop(self) -> None:
-        # Cleanup plugin resources
-        pass
-'''
+    plugin_stub = _PLUGIN_STUB_TEMPLATE.format(
+        class_name=class_name, name=name, capability=capability
+    )
 
     try:
         out.mkdir(parents=True, exist_ok=True)
-        filename.write_text(plugin_stub.strip() + "\n", encoding="utf-8")
+        filename.write_bytes(plugin_stub.encode("utf-8"))
         console.print(f"[green]✅ Plugin scaffold created:[/green] {filename}")
     except Exception as e:
         console.print(f"[red]❌ Failed to write file:[/red] {e}")
@@ -133,7 +189,10 @@ def test_plugin(
     • Works with a standalone `.py` file or an installed module path.
     • Emits a non‑zero exit‑code on failure (good for CI).
     """
-    from nuvom.plugins.contracts import Plugin
+    import importlib.util
+    import traceback
+
+    console = _console()
 
     # ------------------------
     # Step 1: Load the module
@@ -155,12 +214,8 @@ def test_plugin(
     # ------------------------
     # Step 2: Find Plugin subclass
     # ------------------------
-    plugin = None
-    for attr_name in dir(module):
-        attr = getattr(module, attr_name)
-        if isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin:
-            plugin = attr()
-            break
+    plugin_cls = _find_plugin_class(module)
+    plugin = plugin_cls() if plugin_cls else None
 
     if not plugin:
         console.print("[red]❌ No valid Plugin subclass found.[/red]")
@@ -170,14 +225,18 @@ def test_plugin(
     # Step 3: Validate metadata
     # ------------------------
     errors = []
-    if plugin.api_version.split(".")[0] != API_VERSION.split(".")[0]:
-        errors.append(f"API version mismatch: plugin={plugin.api_version}, core={API_VERSION}")
-    if not plugin.provides:
+    api_version = getattr(plugin, "api_version", None)
+    if not api_version:
+        errors.append("Missing `api_version`.")
+    elif api_version.split(".", 1)[0] != API_VERSION.split(".", 1)[0]:
+        errors.append(f"API version mismatch: plugin={api_version}, core={API_VERSION}")
+    if not getattr(plugin, "provides", None):
         errors.append("Missing `provides`.")
-    if not callable(getattr(plugin, "start", None)):
-        errors.append("Missing or invalid `start()`.")
-    if not callable(getattr(plugin, "stop", None)):
-        errors.append("Missing or invalid `stop()`.")
+    errors.extend(
+        f"Missing or invalid `{hook}()`."
+        for hook in _PLUGIN_HOOKS
+        if not callable(getattr(plugin, hook, None))
+    )
 
     if errors:
         for err in errors:
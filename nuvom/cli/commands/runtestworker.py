@@ -19,6 +19,7 @@ from rich.panel import Panel
 from nuvom.job import Job
 from nuvom.log import get_logger
 from nuvom.registry.auto_register import auto_register_from_manifest
+from nuvom.utils.compat_utils import json_compat
 
 runtest_app = typer.Typer(
     help=(
@@ -58,7 +59,8 @@ def runtestworker(
 
     # ── Load JSON payload ───────────────────────────────────────────────
     try:
-        payload = json.loads(job_file.read_text(encoding="utf-8"))
+        # Parse the raw bytes – no intermediate str decode (orjson if installed).
+        payload = json_compat.loads(job_file.read_bytes())
     except json.JSONDecodeError as exc:
         console.print(Panel(str(exc), title="Invalid JSON", style="bold red"))
         sys.exit(1)
@@ -0,0 +1,131 @@
+# nuvom/cli/lazy.py
+
+"""
+Lazy registration of Typer sub-apps for the `nuvom` CLI.
+
+Each sub-app (discover, list, inspect, …) lives in its own module and pulls in
+a sizeable dependency stack (rich tables, result backends, the discovery
+parser).  Instead of importing every module when `nuvom` starts, the root
+command is built with a `LazyGroup` that only imports a sub-app once the user
+actually invokes it.
+
+`nuvom --help` renders lightweight placeholders carrying the same help text
+and panel, so the listing looks identical to the eager version.
+
+Set ``NUVOM_EAGER=1`` to resolve every sub-app when the CLI boots instead –
+useful in production so a broken import fails at startup, not mid-run.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Type
+
+import click
+import typer
+from typer.core import TyperGroup
+
+EAGER_ENV_VAR = "NUVOM_EAGER"
+
+
+def eager_imports_enabled() -> bool:
+    """Return True when `NUVOM_EAGER=1` asks for all sub-apps to load at boot."""
+    return os.environ.get(EAGER_ENV_VAR) == "1"
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """
+    Declarative description of a sub-app that is imported on first use.
+
+    Attributes:
+        name (str): Command name as typed on the command line.
+        import_path (str): ``"package.module:attr"`` pointing at a `typer.Typer`.
+        help (str): One-line help shown in `nuvom --help`.
+        rich_help_panel (Optional[str]): Help panel the command is listed under.
+    """
+
+    name: str
+    import_path: str
+    help: str
+    rich_help_panel: Optional[str] = None
+
+    def load(self) -> click.Command:
+        """Import the target module and build the real click group."""
+        module_path, _, attr = self.import_path.partition(":")
+        sub_app: typer.Typer = getattr(importlib.import_module(module_path), attr)
+
+        command = typer.main.get_group(sub_app)
+        command.name = self.name
+        if self.rich_help_panel:
+            command.rich_help_panel = self.rich_help_panel  # type: ignore[attr-defined]
+        return command
+
+    def placeholder(self) -> click.Command:
+        """Return a help-only stand-in that does not import anything."""
+        command = click.Command(self.name, help=self.help)
+        command.rich_help_panel = self.rich_help_panel  # type: ignore[attr-defined]
+        return command
+
+
+class LazyGroup(TyperGroup):
+    """
+    TyperGroup that resolves `lazy_subcommands` on demand.
+
+    Subclasses are created with :func:`lazy_group`, which binds the
+    sub-command table as a class attribute (Typer instantiates `cls` itself).
+    """
+
+    lazy_subcommands: Dict[str, LazySubcommand] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._loaded: Dict[str, click.Command] = {}
+        self._help_only = False
+
+        if eager_imports_enabled():
+            for name, spec in self.lazy_subcommands.items():
+                self._loaded[name] = spec.load()
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        spec = self.lazy_subcommands.get(cmd_name)
+        if spec is None:
+            return super().get_command(ctx, cmd_name)
+
+        if cmd_name in self._loaded:
+            return self._loaded[cmd_name]
+
+        if self._help_only:
+            return spec.placeholder()
+
+        command = self._loaded[cmd_name] = spec.load()
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # Listing commands must not trigger imports – only invocation does.
+        self._help_only = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._help_only = False
+
+
+def lazy_group(*subcommands: LazySubcommand) -> Type[LazyGroup]:
+    """
+    Build a `LazyGroup` subclass bound to the given sub-commands.
+
+    Example:
+        app = typer.Typer(cls=lazy_group(
+            LazySubcommand("history", "nuvom.cli.commands.history:history_app", "Show recent jobs."),
+        ))
+    """
+    return type(
+        "LazyGroup",
+        (LazyGroup,),
+        {"lazy_subcommands": {s.name: s for s in subcommands}},
+    )
@@ -3,7 +3,10 @@
 """
 Central configuration loader for Nuvom, powered by:
 - dotenv for `.env` injection
-- Pydantic for strict validation and schema enforcement
+- A frozen dataclass with explicit type coercion and range checks
+
+Settings are read once per process, so a full validation framework would only
+add import time; the checks below cover every field Nuvom defines.
 
 Supports:
 - Static and plugin-defined result, queue, and scheduler backends
@@ -13,13 +16,16 @@ Supports:
 
 from __future__ import annotations
 
+import dataclasses
+import os
+import sys
 import threading
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Any, Dict, Literal, Tuple, get_args, get_origin, get_type_hints
 
-from dotenv import load_dotenv
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
 # ------------------------------------------------------------------ #
 # Constants & environment setup
@@ -28,24 +34,42 @@ ROOT_DIR = Path(".").resolve()
 ENV_PATH = ROOT_DIR / ".env"
 PROJECT_ENV_PATH = Path(".env")
 
-# Pre-load environment variables:
-# 1. Try .env in the current working directory (project root in most cases)
-# 2. Fallback to the internal .env for local dev
-if not load_dotenv(override=True):  # returns False if no .env was found
-    load_dotenv(dotenv_path=ENV_PATH, override=True)
+# Prefer project-level .env, fallback to internal one for dev
+ENV_FILE = PROJECT_ENV_PATH if PROJECT_ENV_PATH.exists() else ENV_PATH
+ENV_PREFIX = "NUVOM_"
 
 # Supported built-in backends.
 _BUILTIN_BACKENDS = {"file", "redis", "sqlite", "memory"}
 
+# Marks a field the caller did not pass; it is then read from the environment.
+# Kept across `importlib.reload` so classes created before a reload still work.
+_UNSET: Any = globals().get("_UNSET", object())
+
+
+def _setting(default: Any, *, ge: int | None = None, le: int | None = None) -> Any:
+    """Declare a settings field with its default and optional integer bounds."""
+    return field(default=_UNSET, metadata={"default": default, "ge": ge, "le": le})
+
+
+# `slots=True` (3.10+) drops the per-instance __dict__: attribute reads on the
+# hot path (`settings.batch_size` per job) become slot lookups. Older
+# interpreters fall back to a regular frozen dataclass.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-class NuvomSettings(BaseSettings):
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class NuvomSettings:
     """
     Global Nuvom configuration.
 
-    Values are loaded from:
-    - Environment variables prefixed with `NUVOM_`
+    Values are loaded from (highest priority first):
+    - Keyword arguments passed to the constructor
+    - Environment variables prefixed with `NUVOM_` (case-insensitive)
+    - The `.env` file (`ENV_FILE`)
     - Defaults defined in this class
 
+    Instances are immutable and safe to share across threads.
+
     Attributes
     ----------
     retry_delay_secs : int
@@ -78,52 +102,57 @@ class NuvomSettings(BaseSettings):
         Path for SQLite queue database.
     prometheus_port : int
         Port for Prometheus metrics exporter.
-    """
 
-    # Prefer project-level .env, fallback to internal one for dev
-    model_config = SettingsConfigDict(
-        env_file=PROJECT_ENV_PATH if PROJECT_ENV_PATH.exists() else ENV_PATH,
-        env_prefix="NUVOM_",
-        extra="ignore",
-    )
+    Raises
+    ------
+    ValueError
+        If a value cannot be coerced to its field type, is not one of the
+        allowed literals, or is out of range.
+    """
 
     # ---------------- Core ---------------- #
-    retry_delay_secs: int = 5
-    environment: Literal["dev", "prod", "test"] = "dev"
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
-
-    result_backend: Annotated[
-        str,
-        Field(description="Backend used to store job results (built-in or plugin)")
-    ] = "sqlite"
+    retry_delay_secs: int = _setting(5)
+    environment: Literal["dev", "prod", "test"] = _setting("dev")
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = _setting("INFO")
 
-    queue_backend: Annotated[
-        str,
-        Field(description="Backend used to enqueue jobs (built-in or plugin)")
-    ] = "sqlite"
+    # Backend used to store job results (built-in or plugin)
+    result_backend: str = _setting("sqlite")
+    # Backend used to enqueue jobs (built-in or plugin)
+    queue_backend: str = _setting("sqlite")
+    # Backend used to store and manage scheduled jobs (built-in or plugin)
+    scheduler_backend: str = _setting("sqlite")
 
-    scheduler_backend: Annotated[
-        str,
-        Field(description="Backend used to store and manage scheduled jobs (built-in or plugin)")
-    ] = "sqlite"
-
-    serialization_backend: Literal["json", "msgpack", "pickle"] = "msgpack"
+    serialization_backend: Literal["json", "msgpack", "pickle"] = _setting("msgpack")
 
     # ---------------- Worker / Queue ---------------- #
-    queue_maxsize: int = 0
-    max_workers: int = 4
-    batch_size: Annotated[int, Field(ge=1)] = 1
-    job_timeout_secs: int = 1
-    timeout_policy: Literal["fail", "retry", "ignore"] = "fail"
+    queue_maxsize: int = _setting(0)
+    max_workers: int = _setting(4)
+    batch_size: int = _setting(1, ge=1)
+    job_timeout_secs: int = _setting(1)
+    timeout_policy: Literal["fail", "retry", "ignore"] = _setting("fail")
 
     # ---------------- SQLite ---------------- #
-    sqlite_db_path: Path = ".nuvom/result.db"
-    sqlite_queue_path: Path = ".nuvom/queue.db"
+    sqlite_db_path: Path = _setting(Path(".nuvom/result.db"))
+    sqlite_queue_path: Path = _setting(Path(".nuvom/queue.db"))
 
     # ---------------- Monitoring ---------------- #
-    prometheus_port: Annotated[int, Field(ge=1, le=65535)] = 9150
+    prometheus_port: int = _setting(9150, ge=1, le=65535)
+
+    # ---------------- Validation ---------------- #
+    def __post_init__(self) -> None:
+        env: Dict[str, str] | None = None
+        for name, hint, meta in _field_specs(type(self)):
+            value = getattr(self, name)
+            if value is _UNSET:
+                if env is None:
+                    env = _read_env()
+                value = env.get(name, meta["default"])
+            object.__setattr__(self, name, _coerce(name, hint, value, meta))
+
+        self._validate_backend(self.result_backend, "result")
+        self._validate_backend(self.queue_backend, "queue")
+        self._validate_backend(self.scheduler_backend, "scheduler")
 
-    # ---------------- Validators ---------------- #
     @staticmethod
     def _validate_backend(v: str, field_name: str) -> str:
         """Internal helper to validate or warn for plugin-defined backends."""
@@ -134,31 +163,6 @@ class NuvomSettings(BaseSettings):
             )
         return v
 
-    @field_validator("result_backend", mode="before")
-    @classmethod
-    def _validate_result_backend(cls, v: str) -> str:
-        return cls._validate_backend(v, "result")
-
-    @field_validator("queue_backend", mode="before")
-    @classmethod
-    def _validate_queue_backend(cls, v: str) -> str:
-        return cls._validate_backend(v, "queue")
-
-    @field_validator("scheduler_backend", mode="before")
-    @classmethod
-    def _validate_scheduler_backend(cls, v: str) -> str:
-        return cls._validate_backend(v, "scheduler")
-
-    @field_validator("sqlite_db_path", mode="before")
-    @classmethod
-    def _coerce_sqlite_path(cls, v) -> Path:
-        return Path(v) if not isinstance(v, Path) else v
-
-    @field_validator("sqlite_queue_path", mode="before")
-    @classmethod
-    def _coerce_sqlite_queue_path(cls, v) -> Path:
-        return Path(v) if not isinstance(v, Path) else v
-
     # ---------------- Developer helpers ---------------- #
     def summary(self) -> dict:
         """
@@ -193,6 +197,83 @@ class NuvomSettings(BaseSettings):
             logger.info(f"{k:20} = {v}")
 
 
+
+# ------------------------------------------------------------------ #
+# Field coercion helpers
+# ------------------------------------------------------------------ #
+@lru_cache(maxsize=None)
+def _field_specs(cls: type) -> Tuple[Tuple[str, Any, Any], ...]:
+    """(name, resolved type hint, metadata) per field, resolved once per class."""
+    hints = get_type_hints(cls)
+    return tuple((f.name, hints[f.name], f.metadata) for f in fields(cls))
+
+
+# Parsed env file: (path, mtime_ns, size) of the parse → its non-empty values.
+_ENV_CACHE: tuple[tuple, Dict[str, str]] | None = None
+
+
+def _env_file_values() -> Dict[str, str]:
+    """Values from the env file, re-parsed only when its stat signature changes."""
+    global _ENV_CACHE
+    try:
+        st = os.stat(ENV_FILE)
+    except OSError:
+        return {}
+
+    key = (str(ENV_FILE), st.st_mtime_ns, st.st_size)
+    if _ENV_CACHE is None or _ENV_CACHE[0] != key:
+        values = {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+        _ENV_CACHE = (key, values)
+    return _ENV_CACHE[1]
+
+
+# Export the env file into os.environ once per process (values win over the
+# inherited environment), so task code and child processes see it too. This
+# reuses the parse cached above instead of a second `load_dotenv` pass. The
+# flag lives in the module namespace, which `importlib.reload` reuses, so
+# reloading this module neither re-reads the file nor clobbers variables that
+# were changed after startup.
+if not globals().get("_DOTENV_LOADED"):
+    os.environ.update(_env_file_values())
+    _DOTENV_LOADED = True
+
+
+def _read_env() -> Dict[str, str]:
+    """Field name → raw string from the env file, overridden by `NUVOM_*` vars."""
+    raw: Dict[str, str] = dict(_env_file_values())
+    raw.update(os.environ)
+
+    prefix_len = len(ENV_PREFIX)
+    return {
+        key[prefix_len:].lower(): value
+        for key, value in raw.items()
+        if key.upper().startswith(ENV_PREFIX)
+    }
+
+
+def _coerce(name: str, hint: Any, value: Any, meta: Any) -> Any:
+    """Convert `value` to the field's type and enforce its constraints."""
+    try:
+        if get_origin(hint) is Literal:
+            choices = get_args(hint)
+            if value not in choices:
+                raise ValueError(f"expected one of {choices}")
+        elif hint is int:
+            value = int(value)
+        elif hint is Path:
+            value = value if isinstance(value, Path) else Path(value)
+        elif hint is str:
+            value = str(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid setting {name}={value!r}: {exc}") from None
+
+    if meta["ge"] is not None and value < meta["ge"]:
+        raise ValueError(f"Invalid setting {name}={value!r}: must be >= {meta['ge']}")
+    if meta["le"] is not None and value > meta["le"]:
+        raise ValueError(f"Invalid setting {name}={value!r}: must be <= {meta['le']}")
+    return value
+
+
 # ------------------------------------------------------------------ #
 # Singleton accessor
 # ------------------------------------------------------------------ #
@@ -200,6 +281,49 @@ _settings: NuvomSettings | None = None
 _settings_lock = threading.Lock()
 
 
+def _reinit_lock_after_fork() -> None:
+    """Give a forked child a fresh lock; the parent's may be held by a thread
+    that does not exist in the child."""
+    global _settings_lock
+    _settings_lock = threading.Lock()
+
+
+# A forked child keeps the parent's validated `_settings` (copy-on-write), so
+# it never rebuilds them from the environment; only the lock needs renewing.
+if hasattr(os, "register_at_fork") and not globals().get("_FORK_HOOK_REGISTERED"):
+    os.register_at_fork(after_in_child=_reinit_lock_after_fork)
+    _FORK_HOOK_REGISTERED = True
+
+# Last instance built from the environment, with the fingerprint of the inputs
+# it came from. Lets a forced reload skip re-reading the .env file and
+# re-validating when neither the file nor any NUVOM_* variable has changed.
+_settings_snapshot: tuple[tuple, NuvomSettings] | None = None
+
+
+def _env_fingerprint() -> tuple:
+    """Identify the inputs NuvomSettings is built from: env file + NUVOM_* vars."""
+    try:
+        env_mtime = os.stat(ENV_FILE).st_mtime_ns
+    except OSError:
+        env_mtime = 0
+    nuvom_env = frozenset(
+        (k, v) for k, v in os.environ.items() if k.upper().startswith(ENV_PREFIX)
+    )
+    return (str(ENV_FILE), env_mtime, nuvom_env)
+
+
+def _load_settings() -> NuvomSettings:
+    """Build settings from the environment, reusing the last instance when possible."""
+    global _settings_snapshot
+    fingerprint = _env_fingerprint()
+    if _settings_snapshot is not None and _settings_snapshot[0] == fingerprint:
+        return _settings_snapshot[1]  # immutable, so safe to hand out again
+
+    settings = NuvomSettings()
+    _settings_snapshot = (fingerprint, settings)
+    return settings
+
+
 def get_settings(force_reload: bool = False) -> NuvomSettings:
     """
     Return the global settings singleton.
@@ -208,6 +332,8 @@ def get_settings(force_reload: bool = False) -> NuvomSettings:
     ----------
     force_reload : bool, default False
         Forces re-loading of settings, useful for testing or runtime updates.
+        When the environment is unchanged the previously validated values
+        are reused, so this is cheap.
 
     Returns
     -------
@@ -215,25 +341,52 @@ def get_settings(force_reload: bool = False) -> NuvomSettings:
         Singleton instance of the configuration.
     """
     global _settings
-    if _settings is None or force_reload:
-        with _settings_lock:
-            if _settings is None or force_reload:
-                _settings = NuvomSettings()
-    return _settings
+    # Hot path: one global read, no lock. The lock is only taken to build or
+    # rebuild the instance, and the local keeps a concurrent reset_settings()
+    # from making this call return None.
+    settings = _settings
+    if settings is not None and not force_reload:
+        return settings
+
+    with _settings_lock:
+        if _settings is None or force_reload:
+            _settings = _load_settings()
+        return _settings
+
+
+def reset_settings() -> None:
+    """
+    Drop the cached settings singleton.
+
+    The next `get_settings()` call re-reads the environment. Intended for
+    tests and for long-lived processes that reload configuration.
+    """
+    global _settings, _settings_snapshot, _ENV_CACHE
+    with _settings_lock:
+        _settings = None
+        _settings_snapshot = None
+        _ENV_CACHE = None
 
 
 def override_settings(**kwargs):
     """
-    Deprecated: Mutate the global settings singleton for testing.
+    Deprecated: Replace the global settings singleton with an overridden copy,
+    for testing.
+
+    Settings are immutable, so this swaps in ``dataclasses.replace(s, **kwargs)``
+    (values are coerced and validated like any other input); code that
+    re-reads `get_settings()` sees the new values.
 
     Prefer:
     -------
     - Initializing a fresh NuvomSettings object with overrides, or
     - Using dependency injection in components for better isolation.
     """
+    global _settings
     s = get_settings()
-    for key, value in kwargs.items():
-        if hasattr(s, key):
-            setattr(s, key, value)
-        else:
-            raise AttributeError(f"Invalid config key: '{key}'")
+    unknown = kwargs.keys() - {f.name for f in fields(s)}
+    if unknown:
+        raise AttributeError(f"Invalid config key: '{sorted(unknown)[0]}'")
+
+    with _settings_lock:
+        _settings = dataclasses.replace(s, **kwargs)
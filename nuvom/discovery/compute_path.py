@@ -6,11 +6,25 @@ relative to a root directory. Converts file path to dot notation and
 removes the `.py` suffix for proper module import paths.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=4096)
 def compute_module_path(file_path: Path, root_path: Path) -> str:
+    """
+    Map `file_path` to a dotted module path relative to `root_path`.
+
+    Built from the path's already-split `parts`, so no string round-trip or
+    separator rewriting is needed. Paths outside `root_path` drop their
+    anchor (`/`, `C:\\`) instead of producing a leading dot.
+
+    Memoized on (file_path, root_path): the result depends only on the two
+    paths, and repeated discovery runs revisit the same files.
+    """
     try:
         rel = file_path.relative_to(root_path)
     except ValueError:
         rel = file_path
-    return str(rel).replace("/", ".").replace("\\", ".").removesuffix(".py")
+    dotted = ".".join(rel.parts[1:] if rel.anchor else rel.parts)
+    # Slice off ".py" rather than building another Path via with_suffix("")
+    return dotted[:-3] if dotted.endswith(".py") else dotted
@@ -2,31 +2,155 @@
 
 """
 Core logic to scan a directory tree and discover all @task definitions.
-Returns a list of TaskReference objects representing discovered tasks.
+Returns a list of TaskReference objects representing discovered tasks
+(or yields them lazily via `iter_tasks`).
 Supports filtering files via include and exclude glob patterns.
 """
 
-from typing import List
+import contextlib
+import os
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from nuvom.discovery.walker import get_python_files
-from nuvom.discovery.parser import find_task_defs
+from nuvom.discovery.parser import iter_task_defs
 from nuvom.discovery.compute_path import compute_module_path
 from nuvom.discovery.reference import TaskReference
+from nuvom.log import get_logger
+from nuvom.utils.compat_utils import json_compat
 
+logger = get_logger()
 
-def discover_tasks(
+# On-disk copy of `_PARSE_CACHE`, so separate `nuvom discover` runs only
+# re-parse edited files. Bump the version when parser results change.
+DEFAULT_PARSE_CACHE_PATH = Path(".nuvom/discovery_cache.json")
+_PARSE_CACHE_VERSION = 2
+
+# Parsed files: path -> (mtime_ns, size, task names). An entry is only reused
+# while the file's stat signature is unchanged, so repeated discovery runs in
+# one process re-parse just the files that were edited.
+_PARSE_CACHE: Dict[str, Tuple[int, int, List[str]]] = {}
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of `path`, or None if it cannot be stat-ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_parse_cache(cache_path: Path) -> Dict[str, Tuple[int, int, List[str]]]:
+    """Read a persisted parse cache; any problem just means an empty cache."""
+    try:
+        data = json_compat.loads(cache_path.read_bytes())
+        if data.get("version") != _PARSE_CACHE_VERSION:
+            return {}
+        return {
+            path: (mtime_ns, size, names)
+            for path, (mtime_ns, size, names) in data["files"].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+        logger.debug("[discovery] Ignoring unreadable parse cache %s: %s", cache_path, e)
+        return {}
+
+
+def _save_parse_cache(cache_path: Path, entries: Dict[str, Tuple[int, int, List[str]]]) -> None:
+    """Atomically write the parse cache; failures are logged and ignored."""
+    data = json_compat.dumps({
+        "version": _PARSE_CACHE_VERSION,
+        "files": {path: list(entry) for path, entry in entries.items()},
+    })
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{cache_path.name}.", suffix=".tmp", dir=cache_path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("[discovery] Could not write parse cache %s: %s", cache_path, e)
+
+
+def iter_tasks(
     root_path: str = ".",
     include: List[str] = [],
-    exclude: List[str] = []
-) -> List[TaskReference]:
-    task_refs: List[TaskReference] = []
-    files = get_python_files(root_path, include, exclude)
+    exclude: List[str] = [],
+    cache_path: Optional[Path] = None,
+    jobs: Optional[int] = None,
+) -> Iterator[TaskReference]:
+    """
+    Lazily yield a TaskReference for every @task found under `root_path`.
 
+    Results are yielded as soon as each file is parsed, so consumers can start
+    processing before the whole tree has been handled. Files unchanged since
+    an earlier run are served from `_PARSE_CACHE`; the rest are parsed (in a
+    process pool for large batches). TaskReferences are built here, in file
+    order.
+
+    Args:
+        root_path (str): Directory to scan.
+        include (List[str]): Glob patterns to include.
+        exclude (List[str]): Glob patterns to exclude.
+        cache_path (Optional[Path]): File that persists parse results across
+            processes (e.g. `DEFAULT_PARSE_CACHE_PATH`). It is read before the
+            scan and rewritten once the scan completes, if anything changed.
+            None keeps the cache in memory only.
+        jobs (Optional[int]): Maximum parser processes (default: CPU count);
+            1 parses serially in this process.
+    """
+    # Resolved once; the walker and compute_module_path both work from it.
     root = Path(root_path).resolve()
-    for file in files:
-        task_names = find_task_defs(file)
+    files = list(get_python_files(str(root), include, exclude))
+    paths = [str(f) for f in files]
+    persisted: Dict[str, Tuple[int, int, List[str]]] = {}
+    if cache_path is not None:
+        persisted = _load_parse_cache(Path(cache_path))
+        for p in paths:
+            if p not in _PARSE_CACHE and p in persisted:
+                _PARSE_CACHE[p] = persisted[p]
+    signatures = [_stat_signature(p) for p in paths]
+    fresh = [
+        sig is not None and _PARSE_CACHE.get(p, (None, None))[:2] == sig
+        for p, sig in zip(paths, signatures)
+    ]
+    parsed = iter_task_defs([f for f, hit in zip(files, fresh) if not hit], max_workers=jobs)
+
+    for file, file_str, sig, hit in zip(files, paths, signatures, fresh):
+        if hit:
+            task_names = _PARSE_CACHE[file_str][2]
+        else:
+            task_names = next(parsed)
+            if sig is not None:
+                _PARSE_CACHE[file_str] = (*sig, task_names)
+
+        if not task_names:
+            continue
+
+        # Invariant per file – computed once, not once per task.
+        module_path = compute_module_path(file, root_path=root)
         for name in task_names:
-            module_path = compute_module_path(file, root_path=root)
-            task_refs.append(TaskReference(str(file), name, module_path))
+            yield TaskReference(file_str, name, module_path)
+
+    if cache_path is not None:
+        # Entries for this scan only, so deleted files drop out of the cache.
+        entries = {p: _PARSE_CACHE[p] for p in paths if p in _PARSE_CACHE}
+        if entries != persisted:
+            _save_parse_cache(Path(cache_path), entries)
+
 
-    return task_refs
+def discover_tasks(
+    root_path: str = ".",
+    include: List[str] = [],
+    exclude: List[str] = []
+) -> List[TaskReference]:
+    return list(iter_tasks(root_path, include, exclude))
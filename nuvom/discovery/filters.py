@@ -5,19 +5,66 @@ Provides a wrapper around pathspec for gitignore-style pattern matching,
 enabling inclusion/exclusion of files based on user-defined glob patterns.
 """
 
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
 import pathspec
 
+# pathspec tags directory matches with a named group; names must be unique
+# within one regex, so they are dropped when patterns are combined.
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
 
 class PathspecMatcher:
     """
     Wrapper around pathspec to handle gitignore-style pattern matching.
+
+    Patterns are compiled once per distinct pattern list, so repeated
+    discovery runs (e.g. the `--dev` watcher) reuse the compiled matcher.
+    When the set has no negations (`!pattern`) it is folded into a single
+    alternation regex, so each path is tested with one `match` call instead
+    of one per pattern.
     """
     def __init__(self, patterns: List[str]):
-        clean_patterns = [p for p in patterns if p.strip()]
-        self.spec = pathspec.PathSpec.from_lines("gitwildmatch", clean_patterns)
+        self.spec, self._combined = _compile(tuple(p for p in patterns if p.strip()))
+        self._empty = not self.spec.patterns
 
     def matches(self, path: str) -> bool:
+        if self._empty:
+            return False
         # path must be relative to root (or at least use POSIX separators)
         normalized_path = path.replace("\\", "/")
+        if self._combined is not None:
+            return self._combined.match(normalized_path) is not None
         return self.spec.match_file(normalized_path)
+
+
+@lru_cache(maxsize=256)
+def _compile(patterns: Tuple[str, ...]) -> Tuple[pathspec.PathSpec, Optional[Pattern]]:
+    """Build the pathspec for `patterns` and its combined regex, if any."""
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    return spec, _combine(spec)
+
+
+def _combine(spec: pathspec.PathSpec) -> Optional[Pattern]:
+    """
+    Fold the spec's patterns into one regex, or return None when the
+    gitignore "last match wins" semantics cannot be expressed that way.
+    """
+    sources = []
+    flags = set()
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue  # comment / blank line
+        regex = getattr(pattern, "regex", None)
+        if not pattern.include or regex is None:
+            return None
+        sources.append(_NAMED_GROUP.sub("(?:", regex.pattern))
+        flags.add(regex.flags)
+
+    if not sources or len(flags) != 1:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{s})" for s in sources), flags.pop())
+    except re.error:
+        return None
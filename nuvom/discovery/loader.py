@@ -6,29 +6,48 @@ Used to resolve and load task functions based on TaskReference data.
 """
 
 import importlib
-import importlib.util
+import os
 import sys
-import hashlib
+from functools import lru_cache
 from types import ModuleType
-from typing import Callable
+from typing import Callable, Dict, Optional, Tuple
 
 from nuvom.discovery.reference import TaskReference
 from nuvom.log import get_logger
 
 logger = get_logger()
 
+# Synthetic module name -> (mtime_ns, size) of the file it was executed from.
+# A path-loaded module is reused while its file is unchanged; an edited file
+# is executed again, so `--dev` reloads still pick up new code.
+_PATH_MODULE_SIGNATURES: Dict[str, Tuple[int, int]] = {}
+
+# Marks a task name the module does not define (see `load_task`).
+_MISSING = object()
+
+@lru_cache(maxsize=1024)
 def unique_module_name_from_path(path: str) -> str:
     """
     Generate a unique module name based on file path using a hash.
     Prevents module collision in sys.modules.
+
+    Uses a 64-bit BLAKE2b digest: stable across runs (unlike `hash()`), and
+    cheaper than SHA-256 on short inputs. Memoized per path.
     """
-    path_hash = hashlib.sha256(path.encode()).hexdigest()[:12]
+    # Only needed on the file-path fallback; keeps hashlib/OpenSSL out of
+    # worker start-up when every task imports by module name.
+    import hashlib
+
+    path_hash = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
     return f"nuvom_dynamic_{path_hash}"
 
 
 def load_module_from_path(path: str) -> ModuleType:
     """
     Dynamically load a Python module from a file path.
+
+    Returns the module already in `sys.modules` when the file has not changed
+    since it was executed, instead of compiling and executing it again.
     Args:
         path: Absolute file path to the .py source file.
     Returns:
@@ -37,33 +56,55 @@ def load_module_from_path(path: str) -> ModuleType:
         ImportError: If module cannot be loaded or executed.
     """
     module_name = unique_module_name_from_path(path)
+    try:
+        st = os.stat(path)
+        signature: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        signature = None  # let the loader report the problem
+
+    cached = sys.modules.get(module_name)
+    if (
+        cached is not None
+        and signature is not None
+        and _PATH_MODULE_SIGNATURES.get(module_name) == signature
+    ):
+        return cached
+
+    # Only the file-path fallback needs it; module-name imports never do.
+    import importlib.util
+
     spec = importlib.util.spec_from_file_location(module_name, path)
 
     if not spec or not spec.loader:
         raise ImportError(f"Cannot load spec from path: {path}")
 
     module = importlib.util.module_from_spec(spec)
+    # Registered before exec, like a regular import: decorators such as
+    # @dataclass and pickling look the module up in sys.modules by name.
     sys.modules[module_name] = module
 
     try:
         spec.loader.exec_module(module)
     except Exception as e:
+        # Don't leave a half-initialised module behind under its name.
+        sys.modules.pop(module_name, None)
+        _PATH_MODULE_SIGNATURES.pop(module_name, None)
         raise ImportError(f"Failed to exec module {module_name}: {e}")
 
+    if signature is not None:
+        _PATH_MODULE_SIGNATURES[module_name] = signature
     return module
 
 
-def load_task(ref: TaskReference) -> Callable:
+def load_task_module(ref: TaskReference) -> ModuleType:
     """
-    Dynamically load the task function from a TaskReference.
+    Import the module that defines a TaskReference's function.
     Tries to import using module name first, then falls back to file path loading.
     Args:
-        ref: A TaskReference object with module name and function name.
+        ref: A TaskReference object with module name and file path.
     Returns:
-        Callable task function object.
+        The imported module.
     Raises:
-        AttributeError: If the task function is not found in the module.
-        TypeError: If the attribute is not a callable.
         ImportError: If module cannot be loaded.
     """
     module = None
@@ -72,7 +113,7 @@ def load_task(ref: TaskReference) -> Callable:
     if ref.module_name:
         try:
             module = importlib.import_module(ref.module_name)
-            logger.info(f"[loader] ✅ Imported module: {ref.module_name}")
+            logger.debug("[loader] ✅ Imported module: %s", ref.module_name)
         except ImportError as e:
             # logger.warning(f"[loader] ⚠ Failed to import '{ref.module_name}': {e}")
             # logger.info("[loader] ℹ Falling back to loading from file path...")
@@ -81,13 +122,33 @@ def load_task(ref: TaskReference) -> Callable:
     # Fallback to loading from path
     if module is None:
         module = load_module_from_path(ref.file_path)
-        logger.info(f"[loader] ✅ Loaded from path: {ref.file_path}")
+        logger.debug("[loader] ✅ Loaded from path: %s", ref.file_path)
+
+    return module
 
-    # Extract function
-    if not hasattr(module, ref.func_name):
-        raise AttributeError(f"Module '{module.__name__}' has no attribute '{ref.func_name}'")
 
-    func = getattr(module, ref.func_name)
+def load_task(ref: TaskReference, module: Optional[ModuleType] = None) -> Callable:
+    """
+    Dynamically load the task function from a TaskReference.
+    Tries to import using module name first, then falls back to file path loading.
+    Args:
+        ref: A TaskReference object with module name and function name.
+        module: Module already returned by `load_task_module` for a reference
+            to the same file; skips importing it again.
+    Returns:
+        Callable task function object.
+    Raises:
+        AttributeError: If the task function is not found in the module.
+        TypeError: If the attribute is not a callable.
+        ImportError: If module cannot be loaded.
+    """
+    if module is None:
+        module = load_task_module(ref)
+
+    # Extract function – one attribute lookup (hasattr + getattr did two)
+    func = getattr(module, ref.func_name, _MISSING)
+    if func is _MISSING:
+        raise AttributeError(f"Module '{module.__name__}' has no attribute '{ref.func_name}'")
 
     if not callable(func):
         raise TypeError(f"'{ref.func_name}' in '{module.__name__}' is not callable")
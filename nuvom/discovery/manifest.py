@@ -6,14 +6,23 @@ Supports reading, writing, and diffing manifest contents
 to track changes in discovered tasks.
 """
 
+import contextlib
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from nuvom.discovery.reference import TaskReference
 from nuvom.log import get_logger
+from nuvom.utils.compat_utils import json_compat
 
 logger = get_logger()
 
+# Parsed manifests: absolute path -> (mtime_ns, size, tasks). An entry is only
+# reused while the file's stat signature is unchanged.
+_LOAD_CACHE: Dict[str, Tuple[int, int, List[TaskReference]]] = {}
+
 class ManifestManager:
     """
     Handles read/write operations for the manifest file that stores
@@ -42,41 +51,84 @@ class ManifestManager:
         Raises:
             ValueError: If manifest version mismatches expected version.
         """
-        if not self.path.exists():
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
             logger.warning(f"[manifest] No manifest found at {self.path}")
             self.tasks = []
             return []
 
-        with self.path.open("r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"[manifest] Invalid JSON in manifest: {e}")
-                self.tasks = []
-                return []
+        cache_key = os.path.abspath(self.path)
+        cached = _LOAD_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            self.tasks = list(cached[2])
+            return self.tasks
+
+        try:
+            data = json_compat.loads(self.path.read_bytes())  # orjson when installed
+        except json.JSONDecodeError as e:
+            logger.error(f"[manifest] Invalid JSON in manifest: {e}")
+            self.tasks = []
+            return []
 
         if data.get("version") != self.VERSION:
             raise ValueError(f"[manifest] Version mismatch: {data.get('version')} != {self.VERSION}")
 
-        self.tasks = [TaskReference(**item) for item in data.get("tasks", [])]
+        # Positional construction skips building a kwargs dict per task.
+        tasks = [
+            TaskReference(item["file_path"], item["func_name"], item.get("module_name"))
+            for item in data.get("tasks", [])
+        ]
+        _LOAD_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, tasks)
+        self.tasks = list(tasks)
         return self.tasks
 
     def save(self, tasks: List[TaskReference]):
         """
         Save a list of TaskReferences to the manifest file.
 
+        The document is encoded to a single buffer, written to a sibling temp
+        file and moved into place with `os.replace`, so readers (e.g. the
+        `--dev` watcher) never observe a partially written manifest.
+
         Args:
             tasks (List[TaskReference]): Tasks to save.
         """
+        self._write(self._encode(tasks))
+        logger.info(f"[manifest] Saved manifest with {len(tasks)} tasks to {self.path}")
+
+    def _encode(self, tasks: List[TaskReference]) -> bytes:
+        """Encode tasks to the exact bytes `save` writes."""
+        serialize = self._serialize_task  # bound once, not per task
         manifest = {
             "version": self.VERSION,
-            "tasks": [self._serialize_task(t) for t in tasks],
+            "tasks": [serialize(t) for t in tasks],
         }
+        return json_compat.dumps(manifest, indent=True)
+
+    def _write(self, data: bytes) -> None:
+        """
+        Atomically replace the manifest file with `data`.
 
+        Each writer gets its own temp file (`mkstemp` in the target
+        directory), so concurrent `discover` runs cannot truncate or move
+        each other's half-written file; the last `os.replace` wins.
+        """
+        _LOAD_CACHE.pop(os.path.abspath(self.path), None)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
-        logger.info(f"[manifest] Saved manifest with {len(tasks)} tasks to {self.path}")
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)  # one write of the pre-encoded buffer
+            # mkstemp creates 0600 files; keep the manifest readable as before.
+            os.chmod(tmp_path, self._file_mode())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
 
     def _serialize_task(self, task: TaskReference) -> dict:
         """
@@ -103,32 +155,57 @@ class ManifestManager:
         """
         return self.tasks
 
-    def diff_and_save(self, new_tasks: List[TaskReference]) -> dict:
+    def diff_and_save(self, new_tasks: Iterable[TaskReference]) -> dict:
         """
         Compare new task list with existing manifest tasks,
         detect added, removed, and modified tasks,
         and save new manifest if changes exist.
 
         Args:
-            new_tasks (List[TaskReference]): Newly discovered tasks.
+            new_tasks (Iterable[TaskReference]): Newly discovered tasks. May be
+                a lazy iterator (e.g. `iter_tasks`); it is consumed once.
 
         Returns:
             dict: Summary of changes with keys 'added', 'removed',
-                  'modified', and 'saved' (bool).
+                  'modified', 'saved' (bool) and 'total' (tasks seen).
         """
-        old_set = {self._task_key(t): t for t in self.load()}
-        new_set = {self._task_key(t): t for t in new_tasks}
-
-        added = [t for k, t in new_set.items() if k not in old_set]
+        # Single pass over the (possibly lazy) input: keep the ordered list for
+        # saving and the keyed view for diffing.
+        task_key = self._task_key  # bound once, not per task
+        new_list: List[TaskReference] = []
+        new_set: Dict[str, TaskReference] = {}
+        for t in new_tasks:
+            new_list.append(t)
+            new_set[task_key(t)] = t
+
+        # Steady state: the file already holds exactly what would be written,
+        # so skip parsing and diffing it (and rewriting it) altogether.
+        new_data = self._encode(new_list)
+        if self._read_raw() == new_data:
+            self.tasks = list(new_list)
+            logger.info("[manifest] No manifest changes detected.")
+            return {"added": [], "removed": [], "modified": [], "saved": False, "total": len(new_list)}
+
+        old_set = {task_key(t): t for t in self.load()}
+
+        # One pass over the new tasks classifies each as added or modified
+        # (in discovery order, unlike iterating a `keys() & keys()` set);
+        # one more over the old tasks finds the removed ones.
+        added: List[TaskReference] = []
+        modified: List[TaskReference] = []
+        old_get = old_set.get
+        for key, task in new_set.items():
+            old = old_get(key)
+            if old is None:
+                added.append(task)
+            elif old != task:  # same key, so file path or module moved
+                modified.append(task)
         removed = [t for k, t in old_set.items() if k not in new_set]
-        modified = [
-            new_set[k] for k in new_set.keys() & old_set.keys()
-            if self._task_changed(old_set[k], new_set[k])
-        ]
 
         changed = bool(added or removed or modified)
         if changed:
-            self.save(new_tasks)
+            self._write(new_data)
+            logger.info(f"[manifest] Saved manifest with {len(new_list)} tasks to {self.path}")
             logger.info(
                 f"[manifest] Manifest changed: +{len(added)} added, "
                 f"-{len(removed)} removed, ~{len(modified)} modified"
@@ -141,8 +218,23 @@ class ManifestManager:
             "removed": removed,
             "modified": modified,
             "saved": changed,
+            "total": len(new_list),
         }
 
+    def _file_mode(self) -> int:
+        """Permission bits for a rewritten manifest: the current file's, or 0644."""
+        try:
+            return stat.S_IMODE(os.stat(self.path).st_mode)
+        except OSError:
+            return 0o644
+
+    def _read_raw(self) -> Optional[bytes]:
+        """Current manifest bytes, or None if the file cannot be read."""
+        try:
+            return self.path.read_bytes()
+        except OSError:
+            return None
+
     def _task_key(self, task: TaskReference) -> str:
         """
         Compute a unique key for a task used in comparisons.
@@ -154,16 +246,3 @@ class ManifestManager:
             str: Unique string key.
         """
         return f"{task.module_name or task.file_path}:{task.func_name}"
-
-    def _task_changed(self, old: TaskReference, new: TaskReference) -> bool:
-        """
-        Determine if two TaskReferences differ in file path or module.
-
-        Args:
-            old (TaskReference): Old task data.
-            new (TaskReference): New task data.
-
-        Returns:
-            bool: True if changed, False otherwise.
-        """
-        return (old.file_path != new.file_path or old.module_name != new.module_name)
@@ -6,12 +6,45 @@ definitions decorated with @task in Python source files.
 """
 
 import ast
+import os
+import re
+import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional
 from nuvom.log import get_logger
 
 logger = get_logger()
 
+# Decorator names that mark a function as a task.
+_TASK_DECORATORS = frozenset({"task"})
+
+_TASK_DECORATOR_BYTES = tuple(name.encode() for name in _TASK_DECORATORS)
+
+# Cheap byte-level stand-in for the AST check: a line that starts a decorator
+# whose dotted name ends in a task decorator name (`@task`, `@app.task(...)`,
+# `@ (task)`). Files without such a line are not parsed at all.
+_TASK_DECORATOR_LINE = re.compile(
+    rb"^[ \t]*@[ \t(]*(?:[A-Za-z_][\w.]*\.)?(?:"
+    + b"|".join(re.escape(name.encode()) for name in sorted(_TASK_DECORATORS))
+    + rb")\b",
+    re.MULTILINE,
+)
+
+# Below this many files, process start-up costs more than parsing serially.
+_PARALLEL_MIN_FILES = 64
+# Files handed to a worker process per round-trip.
+_PARSE_CHUNKSIZE = 16
+
+# Statements whose nested statement lists may hold task definitions.
+_BLOCK_STATEMENTS = tuple(
+    getattr(ast, name)
+    for name in (
+        "ClassDef", "If", "Try", "TryStar", "With", "AsyncWith",
+        "For", "AsyncFor", "While", "Match",
+    )
+    if hasattr(ast, name)
+)
+
 def find_task_defs(file_path: Path) -> List[str]:
     """
     Parse a Python source file and find all function names decorated with @task.
@@ -21,31 +54,117 @@ def find_task_defs(file_path: Path) -> List[str]:
 
     Returns:
         List[str]: List of function names decorated with @task.
+
+    Files without a line that looks like a task decorator are skipped
+    without being parsed; most modules in a project are not task modules.
+    Candidates are still confirmed with `ast`, so strings or comments that
+    merely look like decorators cannot produce false positives.
     """
     try:
-        source = file_path.read_text(encoding="utf-8")
+        source = file_path.read_bytes()
     except Exception as e:
         logger.warning(f"[parser] Cannot read {file_path}: {e}")
         return []
 
+    # Substring test first (much faster), then the decorator-line regex.
+    if not any(name in source for name in _TASK_DECORATOR_BYTES):
+        return []
+    if _TASK_DECORATOR_LINE.search(source) is None:
+        return []
+
     try:
+        # Bytes go straight to the parser, which honours encoding cookies/BOMs.
         tree = ast.parse(source, filename=str(file_path))
     except SyntaxError as e:
         logger.warning(f"[parser] Syntax error in {file_path}: {e}")
         return []
 
-    tasks = []
-    for node in ast.walk(tree):
+    return [
+        node.name
+        for node in _iter_function_defs(tree.body)
+        if any(_decorator_name(d) in _TASK_DECORATORS for d in node.decorator_list)
+    ]
+
+
+def _iter_function_defs(body: List[ast.stmt]) -> Iterator[ast.FunctionDef]:
+    """
+    Yield function definitions from a statement list, in source order.
+
+    Descends into classes and block statements (`if`, `try`, `with`,
+    loops, `match` cases) but never into function bodies: a task defined inside another
+    function cannot be imported, and those bodies hold most of a file's nodes.
+    """
+    for node in body:
         if isinstance(node, ast.FunctionDef):
-            for decorator in node.decorator_list:
-                if isinstance(decorator, ast.Name) and decorator.id == "task":
-                    tasks.append(node.name)
-                elif isinstance(decorator, ast.Attribute) and decorator.attr == "task":
-                    tasks.append(node.name)
-                elif isinstance(decorator, ast.Call):
-                    # Check if decorator is a call to `task` or `x.task`
-                    func = decorator.func
-                    if (isinstance(func, ast.Name) and func.id == "task") or \
-                       (isinstance(func, ast.Attribute) and func.attr == "task"):
-                        tasks.append(node.name)
-    return tasks
+            yield node
+        elif isinstance(node, _BLOCK_STATEMENTS):
+            for field in ("body", "orelse", "finalbody"):
+                yield from _iter_function_defs(getattr(node, field, ()))
+            for handler in getattr(node, "handlers", ()):
+                yield from _iter_function_defs(handler.body)
+            for case in getattr(node, "cases", ()):
+                yield from _iter_function_defs(case.body)
+
+
+def _decorator_name(decorator: ast.expr) -> Optional[str]:
+    """
+    Return the trailing name of a decorator expression.
+
+    `@task`, `@x.task`, `@task(...)` and `@x.task(...)` all give "task";
+    anything else (subscripts, lambdas, ...) gives None.
+    """
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return None
+
+
+def iter_task_defs(files: List[Path], max_workers: Optional[int] = None) -> Iterator[List[str]]:
+    """
+    Yield `find_task_defs(file)` for each file, in order.
+
+    Parsing is pure per-file CPU work, so large batches are spread across a
+    process pool. Small batches, frozen bundles and daemonic processes (which
+    may not start children) parse in-process, lazily.
+
+    Args:
+        files (List[Path]): Python source files to scan.
+        max_workers (Optional[int]): Cap on worker processes (default: CPU
+            count). 1 always parses in-process.
+
+    Yields:
+        List[str]: Task function names, one list per input file.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, -(-len(files) // _PARSE_CHUNKSIZE))
+    if len(files) < _PARALLEL_MIN_FILES or workers < 2 or getattr(sys, "frozen", False):
+        return map(find_task_defs, files)
+
+    # Imported only when a pool is actually needed (a few ms otherwise spent
+    # on every import of this module).
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    if multiprocessing.current_process().daemon:
+        return map(find_task_defs, files)
+
+    def _parallel() -> Iterator[List[str]]:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(find_task_defs, files, chunksize=_PARSE_CHUNKSIZE)
+
+    return _parallel()
+
+
+def find_task_defs_many(files: List[Path]) -> Dict[Path, List[str]]:
+    """
+    Find @task functions in many files at once (see `iter_task_defs`).
+
+    Args:
+        files (List[Path]): Python source files to scan.
+
+    Returns:
+        Dict[Path, List[str]]: Task function names per file.
+    """
+    return dict(zip(files, iter_task_defs(files)))
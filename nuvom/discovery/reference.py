@@ -5,6 +5,7 @@ Defines TaskReference, representing a discovered task's metadata and
 provides dynamic loading of the task function from module or file.
 """
 
+import sys
 from typing import Optional
 
 
@@ -12,16 +13,36 @@ class TaskReference:
     """
     Represents metadata about a discovered task.
 
+    References compare (and hash) by value, so manifest diffs can compare a
+    stored reference with a rediscovered one directly.
+
     Attributes:
         file_path (str): Absolute or relative path to the Python file.
         func_name (str): Name of the task function.
         module_name (Optional[str]): Python module path (dot notation).
     """
 
+    # Discovery creates one per task and the manifest keeps them all;
+    # slots keep each instance small and its attribute access direct.
+    __slots__ = ("file_path", "func_name", "module_name")
+
     def __init__(self, file_path: str, func_name: str, module_name: Optional[str] = None):
         self.file_path = file_path
-        self.func_name = func_name
-        self.module_name = module_name
+        # Interned: a manifest repeats each module name once per task, and
+        # names parsed from JSON are otherwise separate copies.
+        self.func_name = sys.intern(func_name)
+        self.module_name = sys.intern(module_name) if module_name else module_name
+
+    def _fields(self):
+        return (self.file_path, self.func_name, self.module_name)
+
+    def __eq__(self, other):
+        if other.__class__ is not TaskReference:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
 
     def __repr__(self):
         return f"<TaskReference {self.module_name or self.file_path}:{self.func_name}>"
@@ -30,21 +51,15 @@ class TaskReference:
         """
         Dynamically load the task function.
 
+        Delegates to `nuvom.discovery.loader.load_task`, so file-path loads get
+        a per-file module name instead of sharing one `sys.modules` slot.
+
         Returns:
             Callable: The task function.
 
         Raises:
             ImportError or AttributeError if loading fails.
         """
-        import importlib.util
-        import sys
-
-        if self.module_name:
-            module = __import__(self.module_name, fromlist=[""])
-        else:
-            spec = importlib.util.spec_from_file_location("dynamic_task_mod", self.file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            sys.modules["dynamic_task_mod"] = module
-
-        return getattr(module, self.func_name)
+        from nuvom.discovery.loader import load_task
+
+        return load_task(self)
@@ -7,7 +7,7 @@ and default excludes like __pycache__, .git, etc.
 """
 
 from pathlib import Path
-from typing import List, Generator
+from typing import FrozenSet, List, Generator, Tuple
 import os
 
 from nuvom.discovery.filters import PathspecMatcher
@@ -17,6 +17,9 @@ DEFAULT_EXCLUDE_DIRS = {"__pycache__", ".venv", ".git", "migrations", ".pytest_c
 NUVOMIGNORE_FILE = ".nuvomignore"
 logger = get_logger()
 
+# Characters that make an ignore line more than a literal name.
+_GLOB_CHARS = frozenset("*?[]\\!")
+
 def load_nuvomignore(root: Path) -> List[str]:
     """
     Load ignore patterns from a .nuvomignore file in the root directory.
@@ -40,6 +43,38 @@ def load_nuvomignore(root: Path) -> List[str]:
     return []
 
 
+def _split_name_excludes(patterns: List[str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Pick out exclude patterns that are plain names.
+
+    In gitignore syntax, a line such as `build` matches any file or
+    directory with that name at any depth, and `build/` matches any
+    directory with that name. Those can be checked with a set lookup
+    before the path reaches pathspec.
+
+    Args:
+        patterns (List[str]): Exclude patterns, in order.
+
+    Returns:
+        Tuple[FrozenSet[str], FrozenSet[str]]: Names excluding files and
+        directories, and names excluding directories only. Both are empty
+        when any pattern is a negation, since `!pattern` lines make the
+        outcome depend on order.
+    """
+    names, dir_names = set(), set()
+    for raw in patterns:
+        pattern = raw.strip()
+        if pattern.startswith("!"):
+            return frozenset(), frozenset()
+        if not pattern or pattern.startswith("#") or _GLOB_CHARS.intersection(pattern):
+            continue
+        if "/" not in pattern:
+            names.add(pattern)
+        elif pattern.endswith("/") and "/" not in pattern[:-1]:
+            dir_names.add(pattern[:-1])
+    return frozenset(names), frozenset(dir_names)
+
+
 def get_python_files(
     root: str,
     include: List[str],
@@ -59,29 +94,55 @@ def get_python_files(
     """
     root_path = Path(root).resolve()
     ignore_patterns = load_nuvomignore(root_path)
-    all_exclude_patterns = list(set(exclude + ignore_patterns))
+    # De-duplicate without reordering: gitignore negations depend on order,
+    # and a stable list lets PathspecMatcher reuse its compiled patterns.
+    all_exclude_patterns = list(dict.fromkeys(exclude + ignore_patterns))
 
     include_matcher = PathspecMatcher(include)
     exclude_matcher = PathspecMatcher(all_exclude_patterns)
+    name_excludes, dir_name_excludes = _split_name_excludes(all_exclude_patterns)
+    pruned_dir_names = DEFAULT_EXCLUDE_DIRS | name_excludes | dir_name_excludes
+
+    # Explicit os.scandir DFS of (directory, POSIX prefix relative to root):
+    # DirEntry type info comes from the directory listing itself, and the
+    # relative prefix is built by concatenation instead of `relative_to`.
+    stack = [(str(root_path), "")]
+    while stack:
+        dirpath, prefix = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue  # unreadable or vanished directory, as os.walk skips it
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Name-only excludes by set lookup first; symlinked
+                # directories are not followed (os.walk's default).
+                if (
+                    name not in pruned_dir_names
+                    and not entry.is_symlink()
+                    and not exclude_matcher.matches(f"{prefix}{name}/")
+                ):
+                    subdirs.append((entry.path, f"{prefix}{name}/"))
+                continue
 
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Filter out default excluded directories
-        dirnames[:] = [d for d in dirnames if d not in DEFAULT_EXCLUDE_DIRS]
-
-        # Apply exclude patterns to directory paths (relative to root)
-        dirnames[:] = [
-            d for d in dirnames
-            if not exclude_matcher.matches(str(Path(dirpath, d).relative_to(root_path).as_posix()) + "/")
-        ]
-
-        for filename in filenames:
-            if not filename.endswith(".py"):
+            if not name.endswith(".py") or name in name_excludes:
                 continue
 
-            full_path = Path(dirpath) / filename
-            relative_path = full_path.relative_to(root_path).as_posix()
+            relative_path = prefix + name
 
             should_include = include_matcher.matches(relative_path) if include else True
 
             if should_include and not exclude_matcher.matches(relative_path):
-                yield full_path
+                yield Path(entry.path)
+
+        # Reversed so subdirectories are visited in listing order.
+        stack.extend(reversed(subdirs))
@@ -4,8 +4,9 @@
 JobRunner executes a single job with timeout handling, lifecycle hooks, retries, 
 and result/error persistence. Uses a thread pool for task execution isolation.
 """
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 
 from nuvom.result_store import set_result, set_error
 from nuvom.queue import get_queue_backend
@@ -15,6 +16,21 @@ from nuvom.config import get_settings
 
 logger = get_logger()
 
+# One single-thread executor per calling (worker) thread, reused across jobs
+# instead of starting and joining a fresh thread for every job. It is dropped,
+# and its thread exits, when the owning worker thread ends.
+_executors = threading.local()
+
+
+def _job_executor() -> ThreadPoolExecutor:
+    """Return the calling thread's job executor, creating it on first use."""
+    executor = getattr(_executors, "executor", None)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nuvom-job")
+        _executors.executor = executor
+    return executor
+
+
 class JobRunner:
     def __init__(self, job, worker_id: int, default_timeout: int):
         self.job = job
@@ -30,32 +46,69 @@ class JobRunner:
         job.retries_left = retries_left
 
         job.mark_running()
-        logger.debug(f"[Runner-{self.worker_id}] Job '{job.func_name}' → RUNNING (timeout={timeout_secs}s)")
+        logger.debug(
+            "[Runner-%s] Job '%s' → RUNNING (timeout=%ss)", self.worker_id, job.func_name, timeout_secs
+        )
 
         if job.before_job:
             try:
                 job.before_job()
-                logger.debug(f"[Runner-{self.worker_id}] before_job hook OK")
+                logger.debug("[Runner-%s] before_job hook OK", self.worker_id)
             except Exception as e:
-                logger.warning(f"[Runner-{self.worker_id}] before_job failed: {e}")
-
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(job.run)
-            try:
-                result = future.result(timeout=timeout_secs)
-
-                if job.after_job:
-                    try:
-                        job.after_job(result)
-                        logger.debug(f"[Runner-{self.worker_id}] after_job hook OK")
-                    except Exception as e:
-                        logger.warning(f"[Runner-{self.worker_id}] after_job failed: {e}")
+                logger.warning("[Runner-%s] before_job failed: %s", self.worker_id, e)
+
+        future = _job_executor().submit(job.run)
+        try:
+            result = future.result(timeout=timeout_secs)
+
+            if job.after_job:
+                try:
+                    job.after_job(result)
+                    logger.debug("[Runner-%s] after_job hook OK", self.worker_id)
+                except Exception as e:
+                    logger.warning("[Runner-%s] after_job failed: %s", self.worker_id, e)
+
+            if job.store_result:
+                set_result(
+                    job_id=job.id,
+                    func_name=job.func_name,
+                    result=result,
+                    args=job.args,
+                    kwargs=job.kwargs,
+                    retries_left=job.retries_left,
+                    attempts=job.max_retries - job.retries_left,
+                    created_at=job.created_at,
+                    completed_at=time.time(),
+                )
+                logger.debug("[Runner-%s] Stored result for '%s'", self.worker_id, job.func_name)
+
+            job.mark_success(result)
+            
+            if self.q.name == 'sqlite':
+                self.q.mark_done(job.id)
+
+            logger.info("[Runner-%s] Job '%s' → SUCCESS", self.worker_id, job.func_name)
+            return job
+
+        except FutureTimeoutError:
+            policy = job.timeout_policy or get_settings().timeout_policy
+            logger.warning("[Runner-%s] Job '%s' TIMED OUT (policy=%s)", self.worker_id, job.func_name, policy)
+
+            if policy == "retry" and job.retries_left > 0:
+                job.retries_left -= 1
+                delay = job.retry_delay_secs or get_settings().retry_delay_secs
+                job.next_retry_at = time.time() + delay
+                logger.info("[Runner-%s] Retrying in %ss", self.worker_id, delay)
+                self.q.enqueue(job)
+                return job
 
+            elif policy == "ignore":
+                logger.info("[Runner-%s] Timeout ignored → storing None", self.worker_id)
                 if job.store_result:
                     set_result(
                         job_id=job.id,
                         func_name=job.func_name,
-                        result=result,
+                        result=None,
                         args=job.args,
                         kwargs=job.kwargs,
                         retries_left=job.retries_left,
@@ -63,50 +116,18 @@ class JobRunner:
                         created_at=job.created_at,
                         completed_at=time.time(),
                     )
-                    logger.debug(f"[Runner-{self.worker_id}] Stored result for '{job.func_name}'")
-
-                job.mark_success(result)
-                
-                if self.q.name == 'sqlite':
-                    self.q.mark_done(job.id)
-
-                logger.info(f"[Runner-{self.worker_id}] Job '{job.func_name}' → SUCCESS")
+                job.mark_success(None)
                 return job
 
-            except FutureTimeoutError:
-                policy = job.timeout_policy or get_settings().timeout_policy
-                logger.warning(f"[Runner-{self.worker_id}] Job '{job.func_name}' TIMED OUT (policy={policy})")
-
-                if policy == "retry" and job.retries_left > 0:
-                    job.retries_left -= 1
-                    delay = job.retry_delay_secs or get_settings().retry_delay_secs
-                    job.next_retry_at = time.time() + delay
-                    logger.info(f"[Runner-{self.worker_id}] Retrying in {delay}s")
-                    self.q.enqueue(job)
-                    return job
-
-                elif policy == "ignore":
-                    logger.info(f"[Runner-{self.worker_id}] Timeout ignored → storing None")
-                    if job.store_result:
-                        set_result(
-                            job_id=job.id,
-                            func_name=job.func_name,
-                            result=None,
-                            args=job.args,
-                            kwargs=job.kwargs,
-                            retries_left=job.retries_left,
-                            attempts=job.max_retries - job.retries_left,
-                            created_at=job.created_at,
-                            completed_at=time.time(),
-                        )
-                    job.mark_success(None)
-                    return job
-
-                else:
-                    return self._handle_failure("Job execution timed out.")
+            else:
+                return self._handle_failure("Job execution timed out.")
 
-            except Exception as e:
-                return self._handle_failure(e)
+        except Exception as e:
+            return self._handle_failure(e)
+        finally:
+            # As before, a timed-out job keeps this worker until it returns;
+            # the next job must not queue behind it on the shared executor.
+            wait([future])
 
     def _handle_failure(self, error) -> Job:
         job = self.job
@@ -114,9 +135,9 @@ class JobRunner:
         if job.on_error:
             try:
                 job.on_error(error)
-                logger.debug(f"[Runner-{self.worker_id}] on_error hook OK")
+                logger.debug("[Runner-%s] on_error hook OK", self.worker_id)
             except Exception as e:
-                logger.warning(f"[Runner-{self.worker_id}] on_error hook failed: {e}")
+                logger.warning("[Runner-%s] on_error hook failed: %s", self.worker_id, e)
 
         job.mark_failed(error)
 
@@ -132,7 +153,7 @@ class JobRunner:
                 created_at=job.created_at,
                 completed_at=time.time(),
             )
-            logger.debug(f"[Runner-{self.worker_id}] Stored error for '{job.func_name}'")
+            logger.debug("[Runner-%s] Stored error for '%s'", self.worker_id, job.func_name)
 
         if job.retries_left > 0:
             job.retries_left -= 1
@@ -140,9 +161,12 @@ class JobRunner:
             delay = job.retry_delay_secs or get_settings().retry_delay_secs
             job.next_retry_at = time.time() + delay
 
-            logger.warning(f"[Runner-{self.worker_id}] Retrying '{job.func_name}' (retry {retry_count}/{job.max_retries})")
+            logger.warning(
+                "[Runner-%s] Retrying '%s' (retry %s/%s)",
+                self.worker_id, job.func_name, retry_count, job.max_retries,
+            )
             self.q.enqueue(job)
         else:
-            logger.error(f"[Runner-{self.worker_id}] Job '{job.func_name}' FAILED permanently: {error}")
+            logger.error("[Runner-%s] Job '%s' FAILED permanently: %s", self.worker_id, job.func_name, error)
 
         return job
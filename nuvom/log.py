@@ -3,9 +3,10 @@
 from __future__ import annotations
 import logging
 import threading
+from contextlib import contextmanager
 from rich.console import Console
 from rich.logging import RichHandler
-from typing import Optional
+from typing import Iterator, Optional
 
 _console = Console()
 _lock = threading.Lock()
@@ -36,3 +37,23 @@ def setup_logger(level: str = "INFO") -> logging.Logger:
 def get_logger(level: str | None = None) -> logging.Logger:
     """Return the configured logger, initialising it if necessary."""
     return _logger or setup_logger(level or "INFO")
+
+
+@contextmanager
+def log_to_stderr() -> Iterator[None]:
+    """
+    Send nuvom log records to stderr for the duration of the block.
+
+    For commands whose stdout is machine-readable (e.g. `--json`), so log
+    lines cannot end up in the redirected output.
+    """
+    handlers = [h for h in get_logger().handlers if isinstance(h, RichHandler)]
+    previous = [h.console for h in handlers]
+    stderr_console = Console(stderr=True)
+    for handler in handlers:
+        handler.console = stderr_console
+    try:
+        yield
+    finally:
+        for handler, console in zip(handlers, previous):
+            handler.console = console
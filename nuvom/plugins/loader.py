@@ -18,7 +18,10 @@ from __future__ import annotations
 
 import importlib
 import importlib.metadata as md
+import os
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Set
@@ -35,12 +38,19 @@ from nuvom.utils.compat_utils.tomllib_compat import tomllib
 
 _TOML_PATH = Path(".nuvom_plugins.toml")
 
-# Set of "module[:attr]" spec strings that have been successfully loaded
+# Set of "module[:attr]" spec strings that have been successfully loaded.
+# Also holds `_DISCOVERY_DONE` once a discovery pass has finished, so a process
+# with no plugins does not rescan entry-points/TOML on every call. Clearing the
+# set therefore forces a full reload.
 _LOADED_SPECS: Set[str] = set()
+_DISCOVERY_DONE = "<discovery-done>"
 
 # Set of instantiated Plugin objects that are active in the current process
 LOADED_PLUGINS: Set[Plugin] = set()
 
+# Upper bound on threads used to import plugin modules concurrently
+_MAX_IMPORT_WORKERS = 8
+
 logger = get_logger()
 _load_lock = threading.Lock()  # Protects against concurrent plugin load attempts
 
@@ -100,6 +110,40 @@ def _import_target(spec: str) -> Any:
     return getattr(module, attr) if attr else module
 
 
+def _import_targets(specs: list[str]) -> dict[str, Any]:
+    """
+    Import every spec, overlapping the file I/O of independent plugin modules.
+
+    Returns a mapping of spec → imported object, or the exception raised while
+    importing it. Only the import is parallel; plugins are still started and
+    registered one by one, in discovery order, by the caller.
+
+    Called from the main thread (e.g. `get_backend()` during worker start-up),
+    specs are imported serially on it, so plugin modules may do main-thread
+    only work such as `signal.signal()` at import time. Called from any other
+    thread, imports run on a small pool: plugin modules must then be safe to
+    import off the main thread.
+    """
+    def _safe_import(spec: str) -> Any:
+        try:
+            return _import_target(spec)
+        except Exception as exc:  # reported by the caller, per spec
+            return exc
+
+    unique = list(dict.fromkeys(specs))
+    # Frozen bundles (PyInstaller & co.) may not tolerate threaded imports.
+    if (
+        len(unique) < 2
+        or getattr(sys, "frozen", False)
+        or threading.current_thread() is threading.main_thread()
+    ):
+        return {spec: _safe_import(spec) for spec in unique}
+
+    workers = min(_MAX_IMPORT_WORKERS, os.cpu_count() or 4, len(unique))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nuvom-plugin-import") as pool:
+        return dict(zip(unique, pool.map(_safe_import, unique)))
+
+
 def _is_duck_plugin(cls: type) -> bool:
     """Check whether a class conforms to the expected Plugin protocol shape."""
     required = ("api_version", "name", "provides", "start", "stop")
@@ -136,12 +180,17 @@ def load_plugins(settings: dict | None = None, extras: dict | None = None) -> No
                         logger.warning("[Plugin] %s.update_runtime() failed – %s", plugin.name, e)
             return
 
-        for spec in _iter_targets():
+        specs = [spec for spec in _iter_targets() if spec not in _LOADED_SPECS]
+        imported = _import_targets(specs)
+
+        for spec in specs:
             if spec in _LOADED_SPECS:
                 continue
 
             try:
-                target = _import_target(spec)
+                target = imported[spec]
+                if isinstance(target, Exception):
+                    raise target
 
                 # ─── Legacy callable plugins ─────────────────────────────────
                 if callable(target) and not isinstance(target, type):
@@ -208,6 +257,8 @@ def load_plugins(settings: dict | None = None, extras: dict | None = None) -> No
                 if isinstance(obj, Plugin):
                     _LOADED_SPECS.add(name)
 
+        _LOADED_SPECS.add(_DISCOVERY_DONE)
+
 
 def shutdown_plugins() -> None:
     """
@@ -5,8 +5,11 @@ Auto-registration logic for loading discovered tasks from manifest
 and injecting them into the global task registry.
 """
 
+from types import ModuleType
+from typing import Dict, Optional, Tuple, Union
+
 from nuvom.discovery.manifest import ManifestManager
-from nuvom.discovery.loader import load_task
+from nuvom.discovery.loader import load_task, load_task_module
 from nuvom.registry.registry import get_task_registry
 from nuvom.log import get_logger
 
@@ -21,7 +24,11 @@ def auto_register_from_manifest(manifest_path: str = None):
                                        If None, the default path is used.
 
     Loads the manifest, dynamically imports each task function,
-    and registers it into the registry with `force=True`.
+    and registers it into the registry with `force=True`. Each task module is
+    imported (or executed from its file path) once, however many tasks it
+    defines. Imports run serially on the calling thread, in manifest order:
+    task modules may do main-thread-only work (e.g. `signal.signal`) at
+    import time.
 
     Logs failures and reports successful registrations.
     """
@@ -29,11 +36,24 @@ def auto_register_from_manifest(manifest_path: str = None):
     discovered_tasks = manifest.load()
     registry = get_task_registry()
 
+    # (module_name, file_path) -> loaded module, or the error raised loading it
+    modules: Dict[Tuple[Optional[str], str], Union[ModuleType, Exception]] = {}
+
     for ref in discovered_tasks:
+        key = (ref.module_name, ref.file_path)
+        if key not in modules:
+            try:
+                modules[key] = load_task_module(ref)
+            except Exception as e:  # reported below, per task
+                modules[key] = e
+
         try:
-            func = load_task(ref)
+            module = modules[key]
+            if isinstance(module, Exception):
+                raise module
+            func = load_task(ref, module=module)
             registry.register(ref.func_name, func, force=True)
-            logger.debug(f"[auto-register] ✅ Registered task '{ref.func_name}' from {ref.module_name}")
+            logger.debug("[auto-register] ✅ Registered task '%s' from %s", ref.func_name, ref.module_name)
         except Exception as e:
             logger.warning(f"[auto-register] ❌ Failed to load task '{ref.func_name}' from {ref.module_name}: {e}")
 
@@ -15,8 +15,9 @@ Changes
 
 from __future__ import annotations
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class BaseResultBackend(ABC):
@@ -92,6 +93,34 @@ class BaseResultBackend(ABC):
         ...
 
     @abstractmethod
-    def list_jobs(self) -> List[Dict]:
-        """Return a list of all stored job records."""
+    def list_jobs(
+        self,
+        *,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Return stored job records, newest first.
+
+        Parameters
+        ----------
+        status : str, optional
+            Only return jobs in this status (``SUCCESS`` / ``FAILED`` / …).
+        limit : int, optional
+            Return at most this many of the most recent jobs.
+
+        Backends should push both filters down to their storage where
+        possible so callers never materialize the full history.
+        """
         ...
+
+    # ------------------------------------------------------------------ #
+    # Helpers for in-process backends
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _newest_first(jobs: Iterable[Dict], limit: Optional[int] = None) -> List[Dict]:
+        """Order records by `created_at` descending, keeping only the top `limit`."""
+        key = lambda j: j.get("created_at") or 0  # noqa: E731
+        if limit:
+            return heapq.nlargest(limit, jobs, key=key)
+        return sorted(jobs, key=key, reverse=True)
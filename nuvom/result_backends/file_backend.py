@@ -144,11 +144,15 @@ class FileResultBackend(BaseResultBackend):
         with open(meta_path, "rb") as f:
             return deserialize(f.read())
 
-    def list_jobs(self) -> list[dict]:
+    def list_jobs(self, *, status: Optional[str] = None, limit: Optional[int] = None) -> list[dict]:
+        """Return stored job records newest first, optionally filtered and capped."""
+        if status:
+            status = status.upper()
         jobs = []
         for file in os.listdir(self.result_dir):
             if file.endswith(".meta"):
                 job_id = file[:-5]  # strip ".meta"
-                if full := self.get_full(job_id):
+                full = self.get_full(job_id)
+                if full and (not status or full.get("status") == status):
                     jobs.append(full)
-        return jobs
+        return self._newest_first(jobs, limit)
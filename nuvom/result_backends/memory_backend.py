@@ -9,7 +9,7 @@ metadata in-memory, including status, return value, error details, and lifecycle
 
 import traceback
 import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from nuvom.serialize import serialize, deserialize
 from nuvom.result_backends.base import BaseResultBackend
@@ -107,11 +107,20 @@ class MemoryResultBackend(BaseResultBackend):
         """
         return self._store.get(job_id)
 
-    def list_jobs(self) -> List[Dict]:
+    def list_jobs(self, *, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
         """
-        Return all job metadata stored in memory.
+        Return job metadata stored in memory, newest first.
+
+        Args:
+            status: Only return jobs with this status.
+            limit: Return at most this many jobs.
 
         Returns:
-            List[Dict]: All job records.
+            List[Dict]: Matching job records.
         """
-        return list(self._store.values())
\ No newline at end of file
+        jobs = self._store.values()
+        if status:
+            status = status.upper()
+            jobs = [j for j in jobs if j["status"] == status]
+        return self._newest_first(jobs, limit)
+
@@ -45,6 +45,10 @@ def _get_connection(db_path: Path) -> sqlite3.Connection:
     if not hasattr(_SQLITE_THREAD_LOCAL, "conn"):
         conn = sqlite3.connect(str(db_path), detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
         conn.execute("PRAGMA journal_mode=WAL;")
+        # Every job result is its own commit. In WAL mode NORMAL syncs at
+        # checkpoints rather than on each commit, and the database stays
+        # consistent; only the latest results can be lost, on power failure.
+        conn.execute("PRAGMA synchronous=NORMAL;")
         conn.row_factory = sqlite3.Row
         _SQLITE_THREAD_LOCAL.conn = conn
 
@@ -229,22 +233,39 @@ class SQLiteResultBackend(BaseResultBackend):
         data["scheduled"] = bool(data.get("scheduled", 0))
         return data
 
-    def list_jobs(self, order_by_priority: bool = False) -> List[Dict]:
+    def list_jobs(
+        self,
+        order_by_priority: bool = False,
+        *,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
         """
-        List all jobs.
+        List jobs, optionally filtered by status and capped at `limit`.
 
         Parameters
         ----------
         order_by_priority : bool
             If True, jobs are sorted by priority ASC, created_at ASC.
+        status : str, optional
+            Only return jobs with this status (uses the status index).
+        limit : int, optional
+            Maximum number of rows to return.
         """
         conn = _get_connection(self.db_path)
         query = "SELECT * FROM jobs"
+        params: list = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status.upper())
         if order_by_priority:
             query += " ORDER BY priority ASC, created_at ASC"
         else:
             query += " ORDER BY created_at DESC"
-        rows = conn.execute(query).fetchall()
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = conn.execute(query, params).fetchall()
 
         output = []
         for r in rows:
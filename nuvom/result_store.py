@@ -8,23 +8,38 @@ Key logic (v0.9+)
 1. Registry-based backend resolution (plugin or built-in)
 2. Plugin autoload via `load_plugins()`
 3. Special constructor case for SQLite (path required)
+4. In-process L1 cache in front of `get_full` (invalidated on writes)
 """
 
 from __future__ import annotations
 
 import threading
-from typing import Any
+from typing import Any, Optional, Tuple
 
 from nuvom.config import get_settings
 from nuvom.log import get_logger
 from nuvom.plugins.loader import load_plugins
 from nuvom.plugins.registry import get_result_backend_cls
+from nuvom.utils.cache_utils.ttl_cache import TTLCache
 
 logger = get_logger()
 
 _backend = None          # Singleton instance
 _backend_lock = threading.Lock()  # Thread safety for lazy init
 
+# L1 cache for get_full(): polling callers hit memory instead of the backend.
+# SUCCESS is final; FAILED may still be retried, so it expires quickly, as do
+# misses (negative caching) and in-flight records.
+_full_cache = TTLCache(maxsize=4096)
+FINAL_TTL_SECS = 300.0
+TRANSIENT_TTL_SECS = 2.0
+
+# Bumped by every invalidation. `get_full` only caches what it fetched if no
+# write happened meanwhile, so a read racing a write cannot re-cache the old
+# record after the write's invalidation.
+_write_seq = 0
+_write_seq_lock = threading.Lock()
+
 
 # --------------------------------------------------------------------------- #
 # Backend factory
@@ -79,6 +94,21 @@ def reset_backend() -> None:
     """Reset singleton instance (for tests or plugin reload)."""
     global _backend
     _backend = None
+    _full_cache.clear()
+
+
+def invalidate(job_id: str) -> None:
+    """
+    Drop any cached metadata for `job_id`.
+
+    Writes call this both before and after the backend write: the second call
+    evicts anything a concurrent `get_full` cached from the old record while
+    the write was in progress.
+    """
+    global _write_seq
+    with _write_seq_lock:
+        _write_seq += 1
+        _full_cache.pop(job_id)
 
 
 # --------------------------------------------------------------------------- #
@@ -96,6 +126,7 @@ def set_result(
     created_at=None,
     completed_at=None,
 ) -> None:
+    invalidate(job_id)
     get_backend().set_result(
         job_id=job_id,
         func_name=func_name,
@@ -107,6 +138,7 @@ def set_result(
         created_at=created_at,
         completed_at=completed_at,
     )
+    invalidate(job_id)
 
 
 def get_result(job_id: str) -> Any:
@@ -125,6 +157,7 @@ def set_error(
     created_at=None,
     completed_at=None,
 ) -> None:
+    invalidate(job_id)
     get_backend().set_error(
         job_id=job_id,
         func_name=func_name,
@@ -136,7 +169,71 @@ def set_error(
         created_at=created_at,
         completed_at=completed_at,
     )
+    invalidate(job_id)
 
 
 def get_error(job_id: str) -> Any:
     return get_backend().get_error(job_id)
+
+
+def get_full(job_id: str) -> Optional[dict]:
+    """
+    Return the full metadata dict for a job, or ``None``.
+
+    Served from the in-process L1 cache while fresh; returns a shallow copy so
+    callers may mutate it freely.
+    """
+    try:
+        meta = _full_cache.get(job_id)
+    except KeyError:
+        seq = _write_seq
+        fetch = getattr(get_backend(), "get_full", None)
+        meta = fetch(job_id) if fetch is not None else None
+        ttl = FINAL_TTL_SECS if meta and meta.get("status") == "SUCCESS" else TRANSIENT_TTL_SECS
+        with _write_seq_lock:
+            if seq == _write_seq:  # else a write raced this read; don't cache it
+                _full_cache.set(job_id, meta, ttl)
+
+    return dict(meta) if meta is not None else None
+
+
+def get_outcome(job_id: str) -> Tuple[str, Any]:
+    """
+    Return ``(status, value)`` for a job with a single backend lookup.
+
+    ``value`` is the deserialized result for ``"SUCCESS"``, the error message
+    for ``"FAILED"`` and ``None`` for ``"PENDING"`` (no terminal record yet).
+    Backends without `get_full` fall back to `get_error` + `get_result`.
+    """
+    backend = get_backend()
+
+    if not hasattr(backend, "get_full"):
+        error = backend.get_error(job_id)
+        if error:
+            return "FAILED", error
+        result = backend.get_result(job_id)
+        if result is not None:
+            return "SUCCESS", result
+        return "PENDING", None
+
+    meta = get_full(job_id) or {}
+    status = meta.get("status")
+
+    if status == "FAILED":
+        error = meta.get("error")
+        if isinstance(error, dict):
+            error = error.get("message")
+        return "FAILED", error or meta.get("error_msg")
+
+    if status == "SUCCESS":
+        result = meta.get("result")
+        if isinstance(result, (bytes, bytearray)):
+            # Some backends keep the serialized blob in their metadata.
+            try:
+                from nuvom.serialize import deserialize
+                result = deserialize(result)
+            except Exception:
+                pass
+        return "SUCCESS", result
+
+    return "PENDING", None
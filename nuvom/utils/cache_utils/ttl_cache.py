@@ -0,0 +1,71 @@
+# nuvom/utils/cache_utils/ttl_cache.py
+
+"""
+Small thread-safe LRU cache with per-entry time-to-live.
+
+Used as an in-process L1 in front of backends that may be remote or
+disk-bound. Entries expire after their own TTL; when `maxsize` is reached the
+least recently used entry is evicted.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a per-entry TTL.
+
+    Args:
+        maxsize (int): Maximum number of live entries.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """
+        Return the cached value for `key`.
+
+        Returns `default` when the key is absent or expired; without a
+        default a `KeyError` is raised so `None` values can be cached.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    return value
+                del self._data[key]
+
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop `key` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
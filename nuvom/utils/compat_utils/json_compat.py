@@ -0,0 +1,63 @@
+"""
+Compatibility module for fast JSON encoding and decoding.
+
+Uses `orjson` (a C extension) when it is installed and falls back to the
+standard-library `json` module otherwise. orjson is optional: install it with
+`pip install nuvom[speedups]`.
+
+Usage:
+    from nuvom.utils.compat_utils.json_compat import dumps, dumps_pretty, loads
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+if orjson is not None:
+    _OPT_COMPACT = orjson.OPT_NON_STR_KEYS
+    _OPT_INDENT = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not valid JSON (orjson's error
+            type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Encode `obj` to UTF-8 JSON bytes, optionally indented by two spaces.
+
+    `default` converts otherwise unsupported values (as in `json.dumps`).
+    Falls back to the stdlib encoder for values orjson refuses
+    (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=default, option=_OPT_INDENT if indent else _OPT_COMPACT
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode("utf-8")
+
+
+def dumps_pretty(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode `obj` as a two-space indented JSON string for display."""
+    return dumps(obj, indent=True, default=default).decode("utf-8")
@@ -1,14 +1,11 @@
 # nuvom/watcher.py
 
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from threading import Thread
 from pathlib import Path
+from typing import Optional
+import threading
 
 from nuvom.log import get_logger
-from nuvom.discovery.manifest import ManifestManager
-from nuvom.discovery.loader import load_task
-from nuvom.registry.registry import get_task_registry
 from nuvom.registry.auto_register import auto_register_from_manifest
 
 
@@ -19,17 +16,66 @@ class ManifestChangeHandler(FileSystemEventHandler):
     """
     Watches the Nuvom manifest file for changes and reloads tasks into the registry
     on-the-fly during --dev mode.
+
+    Editors and `git` typically emit a burst of events for one logical save
+    (write, truncate, rename…). Events are debounced: each one (re)arms a
+    timer, and the reload only runs once the file has been quiet for
+    `debounce_secs`.
     """
 
-    def __init__(self, manifest_path: Path):
+    DEFAULT_DEBOUNCE_SECS = 0.2
+
+    def __init__(self, manifest_path: Path, debounce_secs: float = DEFAULT_DEBOUNCE_SECS):
         self.manifest_path = manifest_path.resolve()
+        self.debounce_secs = debounce_secs
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Each reload runs on its own timer thread; this keeps them from
+        # overlapping when an event arrives while a reload is still running.
+        self._reload_lock = threading.Lock()
 
     def on_modified(self, event):
         """
         Callback triggered when the manifest file is modified.
-        Triggers dynamic task reload from manifest.
+        Schedules a (debounced) task reload from manifest.
         """
-        if Path(event.src_path).resolve() == self.manifest_path:
+        if self._is_manifest(event.src_path):
+            self._schedule_reload()
+
+    def on_created(self, event):
+        """Manifest recreated (e.g. first `discover tasks`)."""
+        if self._is_manifest(event.src_path):
+            self._schedule_reload()
+
+    def on_moved(self, event):
+        """Atomic writers replace the manifest via rename."""
+        if self._is_manifest(getattr(event, "dest_path", "")):
+            self._schedule_reload()
+
+    def _is_manifest(self, path) -> bool:
+        return bool(path) and Path(path).resolve() == self.manifest_path
+
+    def _schedule_reload(self) -> None:
+        """Cancel any pending reload and re-arm the debounce timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_secs, self._reload)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        """Drop a pending reload (called when the observer shuts down)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _reload(self) -> None:
+        with self._lock:
+            self._timer = None
+
+        with self._reload_lock:
             logger.info("[yellow]🔁 Manifest updated — reloading tasks...[/yellow]")
             try:
                 auto_register_from_manifest()
@@ -0,0 +1,68 @@
+# tests/test_cli/test_cli_history.py
+
+import json
+
+from typer.testing import CliRunner
+from nuvom.cli.cli import app
+from nuvom.result_store import set_result, set_error
+
+runner = CliRunner()
+
+def test_history_json_output():
+    set_result("hist-ok", "add", 3, created_at=1.0)
+    set_error("hist-bad", "add", "boom", created_at=2.0)
+
+    result = runner.invoke(app, ["history", "recent", "--json"])
+    assert result.exit_code == 0
+
+    jobs = json.loads(result.stdout)
+    ids = [j["job_id"] for j in jobs]
+    assert ids.index("hist-bad") < ids.index("hist-ok")  # newest first
+
+def test_history_compact_table():
+    set_result("hist-compact", "add", 3, created_at=1.0)
+
+    result = runner.invoke(app, ["history", "recent", "--compact"])
+    assert result.exit_code == 0
+    assert "hist-compact" in result.stdout
+    assert "━" not in result.stdout and "│" not in result.stdout
+
+def test_history_filters_legacy_backends_and_surfaces_backend_errors(monkeypatch):
+    from nuvom.cli.commands import history
+
+    jobs = [
+        {"job_id": "legacy-ok", "status": "SUCCESS", "created_at": 1.0},
+        {"job_id": "legacy-bad", "status": "FAILED", "created_at": 2.0},
+    ]
+
+    class LegacyBackend:
+        def list_jobs(self):
+            return list(jobs)
+
+    monkeypatch.setattr(history, "get_backend", lambda: LegacyBackend())
+    result = runner.invoke(app, ["history", "recent", "--json", "--status", "failed"])
+    assert result.exit_code == 0
+    assert [j["job_id"] for j in json.loads(result.stdout)] == ["legacy-bad"]
+
+    class BuggyBackend:
+        def list_jobs(self, *, status=None, limit=None):
+            raise TypeError("bug inside list_jobs")
+
+    monkeypatch.setattr(history, "get_backend", lambda: BuggyBackend())
+    result = runner.invoke(app, ["history", "recent", "--json"])
+    assert result.exit_code != 0
+    assert isinstance(result.exception, TypeError)
+
+def test_history_json_stdout_is_pure_json_with_real_backend_factory(tmp_path):
+    from nuvom.config import override_settings
+    from nuvom.result_store import reset_backend
+
+    override_settings(result_backend="sqlite", sqlite_db_path=str(tmp_path / "results.db"))
+    reset_backend()
+    set_result("hist-sqlite", "add", 3, created_at=1.0)
+    reset_backend()  # the CLI call resolves (and logs) the backend itself
+
+    result = CliRunner(mix_stderr=False).invoke(app, ["history", "recent", "--json"])
+    assert result.exit_code == 0
+    assert [j["job_id"] for j in json.loads(result.stdout)] == ["hist-sqlite"]
+    assert "Using 'sqlite' backend" in result.stderr
@@ -0,0 +1,32 @@
+# tests/test_cli/test_cli_list.py
+
+from typer.testing import CliRunner
+
+from nuvom.cli.cli import app
+from nuvom.discovery.manifest import ManifestManager
+from nuvom.discovery.reference import TaskReference
+from nuvom.registry.registry import get_task_registry
+
+runner = CliRunner()
+
+def test_list_tasks_shows_registry_metadata(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ManifestManager().save([
+        TaskReference("jobs.py", "tagged_task", "jobs"),
+        TaskReference("jobs.py", "plain_task", "jobs"),
+    ])
+    get_task_registry().register(
+        "tagged_task", lambda: None, metadata={"tags": ["etl", "daily"]}, force=True
+    )
+
+    result = runner.invoke(app, ["list", "tasks"])
+    assert result.exit_code == 0
+    assert "tagged_task" in result.stdout
+    assert "plain_task" in result.stdout
+    assert "etl, daily" in result.stdout
+
+def test_list_tasks_empty_manifest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["list", "tasks"])
+    assert result.exit_code == 0
+    assert "No task definitions found." in result.stdout
@@ -0,0 +1,59 @@
+# tests/test_cli/test_cli_startup.py
+
+"""
+Guard the lazy-import wins of the CLI: cheap commands must not drag in the
+worker, watchdog, or sub-command stacks. Runs in a fresh interpreter since
+the test session itself has already imported everything.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = (
+    "nuvom.worker",
+    "nuvom.watcher",
+    "watchdog",
+    "nuvom.discovery",
+    "nuvom.serialize",
+    "nuvom.cli.commands",
+)
+
+_SNIPPET = """
+from nuvom.cli.cli import app
+app({argv!r}, standalone_mode=False)
+"""
+
+
+def _loaded_modules(argv, tmp_path, **extra_env):
+    profile = tmp_path / "modules.json"
+    proc = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(argv=argv)],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={
+            **{k: v for k, v in os.environ.items() if k != "NUVOM_EAGER"},
+            "PYTHONPATH": os.pathsep.join(sys.path),
+            "NUVOM_STARTUP_PROFILE": str(profile),
+            **extra_env,
+        },
+    )
+    assert proc.returncode == 0, proc.stderr
+    return set(json.loads(profile.read_text()))
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["version"], ["config"]])
+def test_cheap_commands_skip_heavy_imports(argv, tmp_path):
+    loaded = _loaded_modules(argv, tmp_path)
+    leaked = {m for m in loaded if m.startswith(HEAVY_MODULES)}
+    assert not leaked
+
+
+def test_eager_mode_resolves_subcommands_at_boot(tmp_path):
+    loaded = _loaded_modules(["version"], tmp_path, NUVOM_EAGER="1")
+    assert "nuvom.cli.commands.history" in loaded
+    assert "nuvom.cli.commands.discover_tasks" in loaded
@@ -30,3 +30,16 @@ def test_status_pending():
     
     assert result.exit_code == 0
     assert "PENDING" in result.stdout
+
+def test_status_uses_single_full_lookup(monkeypatch):
+    from nuvom.result_store import get_backend
+
+    set_result("job-one-lookup", "test", {"data": 7})
+    backend = get_backend()
+    monkeypatch.setattr(backend, "get_result", lambda _id: pytest.fail("extra lookup"))
+    monkeypatch.setattr(backend, "get_error", lambda _id: pytest.fail("extra lookup"))
+
+    result = runner.invoke(app, ["status", "job-one-lookup"])
+    assert result.exit_code == 0
+    assert "SUCCESS:" in result.stdout
+    assert "'data': 7" in result.stdout
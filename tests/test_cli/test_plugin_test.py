@@ -39,3 +39,28 @@ def test_plugin_test_passes(tmp_path: Path):
 
     assert result.exit_code == 0
     assert "✅ Plugin test_plugin validated successfully." in result.output
+
+
+def test_plugin_test_reports_missing_provides(tmp_path: Path):
+    plugin_file = tmp_path / "bad_plugin.py"
+    plugin_file.write_text(
+        textwrap.dedent(
+            """
+            from nuvom.plugins.contracts import Plugin
+
+            class BadPlugin(Plugin):
+                api_version = "1.0"
+                name = "bad_plugin"
+                provides = []
+
+                def start(self, settings): ...
+                def stop(self): ...
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["plugin", "test", str(plugin_file)])
+
+    assert result.exit_code == 1
+    assert "Missing `provides`." in result.output
@@ -76,3 +76,45 @@ def test_runtestworker_missing_func_name():
     result = runner.invoke(app, ["runtestworker", "run", str(job_file)])
     assert result.exit_code != 0
     assert "Missing 'func_name'" in result.stdout
+
+def test_runtestworker_invalid_json():
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w", encoding="utf-8")
+    tmp.write("{not json")
+    tmp.close()
+
+    result = runner.invoke(app, ["runtestworker", "run", tmp.name])
+    assert result.exit_code == 1
+    assert "Invalid JSON" in result.stdout
+
+def test_runtestworker_reads_job_from_fifo(tmp_path):
+    import os
+    import threading
+
+    import pytest
+
+    if not hasattr(os, "mkfifo"):
+        pytest.skip("FIFOs are not supported on this platform")
+
+    # A FIFO (like `<(echo ...)`) reports st_size == 0; it must be read to EOF
+    fifo = tmp_path / "job.json"
+    os.mkfifo(fifo)
+
+    def _write():
+        with open(fifo, "w", encoding="utf-8") as f:
+            json.dump({"func_name": "add_from_fifo", "args": [1, 2]}, f)
+
+    writer = threading.Thread(target=_write, daemon=True)
+    writer.start()
+
+    task_module = tmp_path / "fifo_tasks.py"
+    task_module.write_text(
+        "from nuvom.task import task\n\n@task()\ndef add_from_fifo(x, y):\n    return x + y\n"
+    )
+
+    result = runner.invoke(app, [
+        "runtestworker", "run", str(fifo), "--task-module", str(task_module)
+    ])
+    writer.join(5)
+
+    assert result.exit_code == 0, result.stdout
+    assert "Result:" in result.stdout and "3" in result.stdout
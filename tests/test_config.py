@@ -0,0 +1,156 @@
+# tests/test_config.py
+
+import dataclasses
+import os
+from pathlib import Path
+
+import pytest
+
+from nuvom.config import NuvomSettings, get_settings, override_settings, reset_settings
+
+
+def test_get_settings_is_memoized():
+    assert get_settings() is get_settings()
+
+
+def test_reset_settings_rereads_environment(monkeypatch):
+    before = get_settings()
+    monkeypatch.setenv("NUVOM_MAX_WORKERS", "7")
+
+    reset_settings()
+    after = get_settings()
+
+    assert after is not before
+    assert after.max_workers == 7
+
+
+def test_force_reload_reuses_instance_when_environment_unchanged(monkeypatch):
+    from nuvom import config
+
+    reset_settings()
+    first = get_settings()
+
+    monkeypatch.setattr(config, "_read_env", lambda: pytest.fail("re-read environment"))
+    assert get_settings(force_reload=True) is first
+    monkeypatch.undo()
+
+    monkeypatch.setenv("NUVOM_MAX_WORKERS", "3")
+    assert get_settings(force_reload=True).max_workers == 3
+
+
+def test_override_settings_rejects_unknown_keys_atomically():
+
+    before = get_settings().max_workers
+    with pytest.raises(AttributeError, match="not_a_setting"):
+        override_settings(max_workers=before + 1, not_a_setting=1)
+    assert get_settings().max_workers == before
+
+    override_settings(max_workers=before + 1)
+    assert get_settings().max_workers == before + 1
+
+
+def test_settings_are_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        get_settings().max_workers = 1
+
+
+def test_settings_coerce_and_validate_environment(monkeypatch):
+    monkeypatch.setenv("NUVOM_PROMETHEUS_PORT", "9200")
+    monkeypatch.setenv("nuvom_sqlite_db_path", "data/results.db")  # case-insensitive
+    settings = NuvomSettings(max_workers="2")
+
+    assert settings.prometheus_port == 9200
+    assert settings.sqlite_db_path == Path("data/results.db")
+    assert settings.max_workers == 2
+
+    with pytest.raises(ValueError, match="timeout_policy"):
+        NuvomSettings(timeout_policy="explode")
+    with pytest.raises(ValueError, match="batch_size"):
+        NuvomSettings(batch_size=0)
+    monkeypatch.setenv("NUVOM_PROMETHEUS_PORT", "70000")
+    with pytest.raises(ValueError, match="prometheus_port"):
+        NuvomSettings()
+
+
+def test_reloading_config_does_not_reread_dotenv(monkeypatch):
+    import importlib
+    import dotenv
+    from nuvom import config
+
+    monkeypatch.setattr(config, "dotenv_values", config.dotenv_values)  # restored afterwards
+    monkeypatch.setattr(dotenv, "dotenv_values", lambda *a, **kw: pytest.fail("re-read .env"))
+    importlib.reload(config)
+
+
+def test_env_file_is_parsed_once_per_revision(monkeypatch, tmp_path):
+    from nuvom import config
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("NUVOM_MAX_WORKERS=5\n")
+    monkeypatch.setattr(config, "ENV_FILE", env_file)
+    monkeypatch.delenv("NUVOM_MAX_WORKERS", raising=False)
+
+    calls = []
+    real_dotenv_values = config.dotenv_values
+    monkeypatch.setattr(
+        config, "dotenv_values", lambda path: calls.append(path) or real_dotenv_values(path)
+    )
+
+    reset_settings()
+    assert NuvomSettings().max_workers == 5
+    assert NuvomSettings().max_workers == 5
+    assert len(calls) == 1
+
+    env_file.write_text("NUVOM_MAX_WORKERS=9\n")  # size changes even if mtime does not
+    assert NuvomSettings().max_workers == 9
+    assert len(calls) == 2
+    reset_settings()
+
+
+def test_env_file_is_exported_to_process_environment(tmp_path):
+    import subprocess
+    import sys
+
+    (tmp_path / ".env").write_text("APP_DSN=sqlite://\nNUVOM_MAX_WORKERS=6\n")
+    code = (
+        "import os; from nuvom.config import get_settings; "
+        "print(os.environ['APP_DSN'], get_settings().max_workers)"
+    )
+    env = {k: v for k, v in os.environ.items() if not k.startswith("NUVOM_")}
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env,
+        capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+    assert out == ["sqlite://", "6"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_reuses_settings_without_deadlock():
+    import threading
+    from nuvom import config
+
+    parent_settings = get_settings()
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with config._settings_lock:
+            held.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait()
+    try:
+        pid = os.fork()
+        if pid == 0:  # child: the holder thread does not exist here
+            ok = get_settings() is parent_settings
+            ok = ok and get_settings(force_reload=True) is not None
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+    finally:
+        release.set()
+        holder.join()
+
+    assert status == 0
@@ -1,7 +1,11 @@
 # tests/test_discovery.py
 
+import sys
 import textwrap
 from pathlib import Path
+
+import pytest
+
 from nuvom.discovery.discover_tasks import discover_tasks
 
 def test_discover_single_task(tmp_path: Path):
@@ -117,3 +121,337 @@ def test_discover_task_with_call_decorator(tmp_path: Path):
 
     names = [t.func_name for t in tasks]
     assert "called_decorator" in names
+
+
+def test_pathspec_matcher_combined_regex_matches_pathspec():
+    from nuvom.discovery.filters import PathspecMatcher
+
+    paths = [
+        "tests/a.py", "x/tests/a.py", "build/x.py", "z/build/y.py",
+        "app/models.py", "app/x/y/models.py", "top.py", "s/top.py", "keep.py",
+    ]
+    for patterns in (
+        ["tests/**", "build/", "app/**/models.py", "/top.py"],
+        ["tests/**", "*.py", "!keep.py"],  # negation → per-pattern fallback
+    ):
+        matcher = PathspecMatcher(patterns)
+        for path in paths:
+            assert matcher.matches(path) == matcher.spec.match_file(path), (patterns, path)
+
+    assert PathspecMatcher([]).matches("anything.py") is False
+    # Same pattern list (blank lines ignored) → compiled once and shared
+    assert PathspecMatcher(["tests/**"]).spec is PathspecMatcher(["tests/**", " "]).spec
+
+
+def test_compute_module_path_is_memoized(tmp_path: Path):
+    from nuvom.discovery.compute_path import compute_module_path
+
+    compute_module_path.cache_clear()
+    file = tmp_path / "pkg" / "jobs.py"
+
+    assert compute_module_path(file, tmp_path) == "pkg.jobs"
+    assert compute_module_path(file, tmp_path) == "pkg.jobs"
+    assert compute_module_path.cache_info().hits == 1
+
+    outside = Path("/elsewhere/tasks/jobs.py")
+    assert compute_module_path(outside, tmp_path) == "elsewhere.tasks.jobs"
+
+
+def test_discover_parses_in_process_pool_in_file_order(tmp_path: Path, monkeypatch):
+    from nuvom.discovery import discover_tasks as dt, parser
+
+    for i in range(5):
+        (tmp_path / f"mod{i}.py").write_text(f"@task\ndef job_{i}():\n    pass\n")
+    (tmp_path / "plain.py").write_text("def helper():\n    pass\n")
+
+    serial = [(t.file_path, t.func_name) for t in discover_tasks(str(tmp_path))]
+
+    monkeypatch.setattr(dt, "_PARSE_CACHE", {})  # parse everything again
+    monkeypatch.setattr(parser, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(parser, "_PARSE_CHUNKSIZE", 2)
+    monkeypatch.setattr(parser.os, "cpu_count", lambda: 2)
+    parallel = [(t.file_path, t.func_name) for t in discover_tasks(str(tmp_path))]
+
+    assert parallel == serial
+    assert sorted(name for _, name in parallel) == [f"job_{i}" for i in range(5)]
+
+    files = sorted(tmp_path.glob("*.py"))
+    assert parser.find_task_defs_many(files) == {f: parser.find_task_defs(f) for f in files}
+
+    # jobs=1 keeps parsing in this process, lazily
+    assert isinstance(parser.iter_task_defs(files, max_workers=1), map)
+
+
+def test_discover_reparses_only_changed_files(tmp_path: Path, monkeypatch):
+    import os
+    from nuvom.discovery import parser
+
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    a.write_text("@task\ndef job_a():\n    pass\n")
+    b.write_text("@task\ndef job_b():\n    pass\n")
+
+    parsed = []
+    real_find = parser.find_task_defs
+    monkeypatch.setattr(parser, "find_task_defs", lambda f: parsed.append(f.name) or real_find(f))
+
+    assert {t.func_name for t in discover_tasks(str(tmp_path))} == {"job_a", "job_b"}
+    assert sorted(parsed) == ["a.py", "b.py"]
+
+    parsed.clear()
+    assert {t.func_name for t in discover_tasks(str(tmp_path))} == {"job_a", "job_b"}
+    assert parsed == []
+
+    b.write_text("@task\ndef job_b2():\n    pass\n")
+    os.utime(b, ns=(b.stat().st_atime_ns, b.stat().st_mtime_ns + 1_000_000))
+    assert {t.func_name for t in discover_tasks(str(tmp_path))} == {"job_a", "job_b2"}
+    assert parsed == ["b.py"]
+
+
+def test_auto_register_loads_each_task_file_once(tmp_path: Path, monkeypatch):
+    from nuvom.discovery import loader
+    from nuvom.discovery.manifest import ManifestManager
+    from nuvom.discovery.reference import TaskReference
+    from nuvom.registry.auto_register import auto_register_from_manifest
+    from nuvom.registry.registry import get_task_registry
+
+    task_file = tmp_path / "jobs.py"
+    task_file.write_text("def job_one():\n    return 1\n\ndef job_two():\n    return 2\n")
+    manifest_path = tmp_path / "manifest.json"
+    ManifestManager(manifest_path).save([
+        TaskReference(str(task_file), "job_one", "not_importable.jobs"),
+        TaskReference(str(task_file), "job_two", "not_importable.jobs"),
+    ])
+
+    loaded = []
+    real_load = loader.load_module_from_path
+    monkeypatch.setattr(loader, "load_module_from_path", lambda p: loaded.append(p) or real_load(p))
+
+    auto_register_from_manifest(manifest_path)
+
+    assert loaded == [str(task_file)]
+    registry = get_task_registry()
+    assert registry.get("job_one")() == 1
+    assert registry.get("job_two")() == 2
+
+
+def test_path_loaded_modules_are_isolated_and_cleaned_up(tmp_path: Path):
+    import sys
+    import pytest
+    from nuvom.discovery.loader import load_module_from_path, unique_module_name_from_path
+    from nuvom.discovery.reference import TaskReference
+
+    a, b, bad = tmp_path / "a.py", tmp_path / "b.py", tmp_path / "bad.py"
+    a.write_text("def job():\n    return 'a'\n")
+    b.write_text("def job():\n    return 'b'\n")
+    bad.write_text("raise RuntimeError('boom')\n")
+
+    job_a = TaskReference(str(a), "job").load()
+    job_b = TaskReference(str(b), "job").load()
+    assert (job_a(), job_b()) == ("a", "b")
+
+    with pytest.raises(ImportError, match="boom"):
+        load_module_from_path(str(bad))
+    assert unique_module_name_from_path(str(bad)) not in sys.modules
+
+
+def test_auto_register_imports_modules_on_calling_thread_and_reports_failures(tmp_path: Path):
+    from nuvom.discovery.manifest import ManifestManager
+    from nuvom.discovery.reference import TaskReference
+    from nuvom.registry.auto_register import auto_register_from_manifest
+    from nuvom.registry.registry import get_task_registry
+
+    refs = []
+    for i in range(4):
+        f = tmp_path / f"mod{i}.py"
+        f.write_text(f"def job_{i}():\n    return {i}\n")
+        refs.append(TaskReference(str(f), f"job_{i}"))
+    broken = tmp_path / "broken.py"
+    broken.write_text("raise RuntimeError('boom')\n")
+    refs.append(TaskReference(str(broken), "never"))
+    # signal.signal only works on the main thread
+    signals = tmp_path / "signals.py"
+    signals.write_text(textwrap.dedent("""
+        import signal
+        signal.signal(signal.SIGINT, signal.getsignal(signal.SIGINT))
+
+        def job_signal():
+            return "signal"
+    """))
+    refs.append(TaskReference(str(signals), "job_signal"))
+
+    manifest_path = tmp_path / "manifest.json"
+    ManifestManager(manifest_path).save(refs)
+    auto_register_from_manifest(manifest_path)
+
+    registry = get_task_registry()
+    assert [registry.get(f"job_{i}")() for i in range(4)] == [0, 1, 2, 3]
+    assert registry.get("job_signal")() == "signal"
+    assert registry.get("never") is None
+
+
+def test_load_module_from_path_reuses_module_until_file_changes(tmp_path: Path):
+    import os
+    from nuvom.discovery.loader import load_module_from_path
+
+    f = tmp_path / "jobs.py"
+    f.write_text("VALUE = 1\n")
+
+    first = load_module_from_path(str(f))
+    assert load_module_from_path(str(f)) is first
+
+    f.write_text("VALUE = 22\n")
+    os.utime(f, ns=(f.stat().st_atime_ns, f.stat().st_mtime_ns + 1_000_000))
+    reloaded = load_module_from_path(str(f))
+    assert reloaded is not first
+    assert reloaded.VALUE == 22
+
+
+def test_find_task_defs_matches_decorator_forms_once(tmp_path: Path):
+    from nuvom.discovery.parser import find_task_defs
+
+    source = tmp_path / "jobs.py"
+    source.write_text(textwrap.dedent("""
+        @task
+        def plain(): ...
+
+        @nuvom.task(retries=2)
+        def called_attr(): ...
+
+        @other
+        @registry[0]
+        def not_a_task(): ...
+
+        @task
+        @app.task
+        def stacked(): ...
+    """))
+
+    assert find_task_defs(source) == ["plain", "called_attr", "stacked"]
+
+
+def test_find_task_defs_scans_blocks_but_not_function_bodies(tmp_path: Path):
+    from nuvom.discovery.parser import find_task_defs
+
+    source = tmp_path / "jobs.py"
+    source.write_text(textwrap.dedent("""
+        try:
+            @task
+            def in_try(): ...
+        except ImportError:
+            @task
+            def in_handler(): ...
+
+        if FEATURE:
+            @task
+            def in_if(): ...
+
+        class Jobs:
+            @task
+            def in_class(self): ...
+
+        async with lock:
+            @task
+            def in_async_with(): ...
+
+        async for item in feed:
+            @task
+            def in_async_for(): ...
+
+        def factory():
+            @task
+            def nested(): ...
+            return nested
+    """))
+
+    assert find_task_defs(source) == [
+        "in_try", "in_handler", "in_if", "in_class", "in_async_with", "in_async_for",
+    ]
+
+    if sys.version_info >= (3, 10):
+        source.write_text(textwrap.dedent("""
+            match MODE:
+                case 1:
+                    @task
+                    def in_match(): ...
+                case _:
+                    @task
+                    def in_default_case(): ...
+        """))
+        assert find_task_defs(source) == ["in_match", "in_default_case"]
+
+
+def test_find_task_defs_skips_parsing_files_without_task(tmp_path: Path, monkeypatch):
+    from nuvom.discovery import parser
+
+    plain = tmp_path / "helpers.py"
+    plain.write_text("def helper():\n    return 1\n")
+    mentions = tmp_path / "client.py"
+    mentions.write_text("# submit a task\n@cache\ndef get_task(task_id):\n    return '@task'\n")
+    monkeypatch.setattr(parser.ast, "parse", lambda *a, **kw: pytest.fail("parsed"))
+    assert parser.find_task_defs(plain) == []
+    assert parser.find_task_defs(mentions) == []
+    monkeypatch.undo()
+
+    # Non-UTF-8 source with an encoding cookie is parsed, not rejected
+    latin1 = tmp_path / "legacy.py"
+    latin1.write_bytes(b"# -*- coding: latin-1 -*-\n@task\ndef job():\n    return 'caf\xe9'\n")
+    assert parser.find_task_defs(latin1) == ["job"]
+
+
+def test_get_python_files_walks_depth_first_without_following_symlinks(tmp_path: Path):
+    from nuvom.discovery.walker import get_python_files
+
+    for rel in ("a.py", "pkg/b.py", "pkg/sub/c.py", "__pycache__/d.py", "pkg/notes.txt"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+    try:
+        (tmp_path / "linked").symlink_to(tmp_path / "pkg", target_is_directory=True)
+    except OSError:
+        pass  # no symlink support; the rest still applies
+
+    found = [p.relative_to(tmp_path).as_posix() for p in get_python_files(str(tmp_path), [], [])]
+
+    assert sorted(found) == ["a.py", "pkg/b.py", "pkg/sub/c.py"]
+    assert found.index("pkg/b.py") < found.index("pkg/sub/c.py")
+
+
+def test_get_python_files_prunes_plain_name_excludes(tmp_path: Path):
+    from nuvom.discovery.walker import _split_name_excludes, get_python_files
+
+    for rel in ("app/jobs.py", "app/build/gen.py", "dist/x.py", "app/dist.py", "app/setup.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+    exclude = ["build", "dist/", "setup.py"]
+
+    found = [p.relative_to(tmp_path).as_posix() for p in get_python_files(str(tmp_path), [], exclude)]
+
+    assert sorted(found) == ["app/dist.py", "app/jobs.py"]
+    assert _split_name_excludes(exclude) == ({"build", "setup.py"}, {"dist"})
+    assert _split_name_excludes(["build", "!build/keep.py"]) == (set(), set())
+
+
+def test_iter_tasks_persists_parse_cache_across_processes(tmp_path: Path, monkeypatch):
+    from nuvom.discovery import discover_tasks as discover_mod, parser
+
+    project, cache_file = tmp_path / "project", tmp_path / "cache" / "discovery.json"
+    project.mkdir()
+    (project / "a.py").write_text("@task\ndef job_a():\n    pass\n")
+
+    parsed = []
+    real_find = parser.find_task_defs
+    monkeypatch.setattr(parser, "find_task_defs", lambda f: parsed.append(f.name) or real_find(f))
+    monkeypatch.setattr(discover_mod, "_PARSE_CACHE", {})
+
+    names = [t.func_name for t in discover_mod.iter_tasks(str(project), cache_path=cache_file)]
+    assert names == ["job_a"] and parsed == ["a.py"] and cache_file.exists()
+
+    # A new process starts with an empty in-memory cache
+    monkeypatch.setattr(discover_mod, "_PARSE_CACHE", {})
+    parsed.clear()
+    names = [t.func_name for t in discover_mod.iter_tasks(str(project), cache_path=cache_file)]
+    assert names == ["job_a"] and parsed == []
+
+    cache_file.write_text("not json")
+    monkeypatch.setattr(discover_mod, "_PARSE_CACHE", {})
+    assert [t.func_name for t in discover_mod.iter_tasks(str(project), cache_path=cache_file)] == ["job_a"]
+    assert parsed == ["a.py"]
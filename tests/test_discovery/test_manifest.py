@@ -0,0 +1,94 @@
+# tests/test_discovery/test_manifest.py
+
+from pathlib import Path
+
+import pytest
+
+from nuvom.discovery import manifest as manifest_mod
+from nuvom.discovery.manifest import ManifestManager
+from nuvom.discovery.reference import TaskReference
+
+
+def test_load_reuses_parsed_manifest_until_file_changes(tmp_path: Path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    ManifestManager(path).save([TaskReference("a.py", "task_a", "a")])
+
+    first = ManifestManager(path).load()
+
+    def _fail(*_a, **_kw):
+        raise AssertionError("manifest was re-parsed")
+
+    monkeypatch.setattr(manifest_mod.json_compat, "loads", _fail)
+    second = ManifestManager(path).load()
+    assert [t.func_name for t in second] == [t.func_name for t in first]
+    monkeypatch.undo()
+
+    ManifestManager(path).save([TaskReference("b.py", "task_b", "b")])
+    assert [t.func_name for t in ManifestManager(path).load()] == ["task_b"]
+
+
+def test_load_missing_manifest_returns_empty(tmp_path: Path):
+    assert ManifestManager(tmp_path / "missing.json").load() == []
+
+
+def test_diff_and_save_skips_parsing_unchanged_manifest(tmp_path: Path, monkeypatch):
+    tasks = [TaskReference("a.py", "job_a", "a"), TaskReference("b.py", "job_b", "b")]
+    manager = ManifestManager(tmp_path / "manifest.json")
+    assert manager.diff_and_save(tasks)["saved"] is True
+
+    monkeypatch.setattr(manager, "load", lambda: pytest.fail("parsed unchanged manifest"))
+    result = manager.diff_and_save(iter(tasks))
+    assert result["saved"] is False and result["total"] == 2
+    assert [t.func_name for t in manager.get_all()] == ["job_a", "job_b"]
+    monkeypatch.undo()
+
+    # Same tasks, different order: parsed and diffed, but nothing to save
+    assert manager.diff_and_save(tasks[::-1])["saved"] is False
+    assert manager.diff_and_save(tasks[:1])["removed"][0].func_name == "job_b"
+
+
+def test_save_replaces_manifest_without_leaving_temp_files(tmp_path: Path):
+    path = tmp_path / "manifest.json"
+    for name in ("task_a", "task_b"):
+        ManifestManager(path).save([TaskReference("a.py", name, "a")])
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["manifest.json"]
+    assert path.stat().st_mode & 0o644 == 0o644  # not mkstemp's private 0600
+    assert [t.func_name for t in ManifestManager(path).load()] == ["task_b"]
+
+
+def test_diff_and_save_classifies_changes_in_discovery_order(tmp_path: Path):
+    manager = ManifestManager(tmp_path / "manifest.json")
+    manager.save([
+        TaskReference("a.py", "job_a", "a"),
+        TaskReference("b.py", "job_b", "b"),
+        TaskReference("c.py", "job_c", "c"),
+    ])
+
+    result = manager.diff_and_save([
+        TaskReference("c2.py", "job_c", "c"),
+        TaskReference("d.py", "job_d", "d"),
+        TaskReference("a.py", "job_a", "a"),
+        TaskReference("b2.py", "job_b", "b"),
+        TaskReference("e.py", "job_e", "e"),
+    ])
+
+    assert [t.func_name for t in result["added"]] == ["job_d", "job_e"]
+    assert [t.func_name for t in result["modified"]] == ["job_c", "job_b"]
+    assert result["removed"] == [] and result["saved"] is True
+
+
+def test_task_references_compare_by_value():
+    ref = TaskReference("a.py", "job_a", "a")
+
+    assert ref == TaskReference("a.py", "job_a", "a")
+    assert ref != TaskReference("a2.py", "job_a", "a")
+    assert len({ref, TaskReference("a.py", "job_a", "a")}) == 1
+
+
+def test_loaded_task_references_share_module_name_strings(tmp_path: Path):
+    path = tmp_path / "manifest.json"
+    ManifestManager(path).save([TaskReference("m.py", f"job_{i}", "app.tasks.m") for i in range(3)])
+
+    loaded = ManifestManager(path).load()
+    assert len({id(t.module_name) for t in loaded}) == 1
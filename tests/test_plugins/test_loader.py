@@ -143,3 +143,54 @@ def test_plugin_version_mismatch_skipped(monkeypatch):
 
     loader.load_plugins()
     assert "plugin.bad:Bad" not in loader.LOADED_PLUGINS
+
+
+def test_load_plugins_skips_rediscovery_when_nothing_found(monkeypatch):
+    from nuvom.plugins import loader
+
+    loader.LOADED_PLUGINS.clear()
+    loader._LOADED_SPECS.clear()
+    calls = []
+    monkeypatch.setattr(loader, "_iter_targets", lambda: calls.append(1) or iter(()))
+
+    loader.load_plugins()
+    loader.load_plugins()
+    assert calls == [1]
+
+    loader._LOADED_SPECS.clear()  # explicit reset forces a new scan
+    loader.load_plugins()
+    assert calls == [1, 1]
+
+
+def test_import_targets_collects_results_and_errors(monkeypatch):
+    from nuvom.plugins import loader
+
+    def fake_import(spec):
+        if spec == "broken":
+            raise ImportError("nope")
+        return spec.upper()
+
+    monkeypatch.setattr(loader, "_import_target", fake_import)
+    result = loader._import_targets(["a", "broken", "b", "a"])
+
+    assert list(result) == ["a", "broken", "b"]
+    assert result["a"] == "A" and result["b"] == "B"
+    assert isinstance(result["broken"], ImportError)
+
+
+def test_import_targets_runs_on_main_thread_when_called_from_it(monkeypatch):
+    import threading
+    from nuvom.plugins import loader
+
+    threads = []
+    monkeypatch.setattr(
+        loader, "_import_target", lambda spec: threads.append(threading.current_thread())
+    )
+    loader._import_targets(["a", "b", "c"])
+    assert set(threads) == {threading.main_thread()}
+
+    threads.clear()
+    worker = threading.Thread(target=loader._import_targets, args=(["a", "b", "c"],))
+    worker.start()
+    worker.join()
+    assert len(threads) == 3 and threading.main_thread() not in threads
@@ -45,3 +45,12 @@ def test_get_result_missing(backend):
 
 def test_get_error_missing(backend):
     assert backend.get_error("missing-job") is None
+
+
+def test_list_jobs_filters_status_and_limit(backend):
+    backend.set_result("old", "test", 1, created_at=1.0)
+    backend.set_result("new", "test", 2, created_at=3.0)
+    backend.set_error("bad", "test", ValueError("x"), created_at=2.0)
+
+    assert [j["job_id"] for j in backend.list_jobs(limit=2)] == ["new", "bad"]
+    assert [j["job_id"] for j in backend.list_jobs(status="SUCCESS")] == ["new", "old"]
@@ -98,3 +98,23 @@ def test_list_jobs_returns_ordered(backend):
 
     # Round-trip: ensure deserialized blobs are usable
     assert jobs[1]["args"] == [40, 2]
+
+
+def test_list_jobs_filters_status_and_limit(backend):
+    _insert_success(backend, "S1")
+    time.sleep(0.01)
+    _insert_failure(backend, "F1")
+    time.sleep(0.01)
+    _insert_success(backend, "S2")
+
+    assert [j["job_id"] for j in backend.list_jobs(status="success")][:2] == ["S2", "S1"]
+    assert all(j["status"] == "FAILED" for j in backend.list_jobs(status="FAILED"))
+    assert [j["job_id"] for j in backend.list_jobs(limit=1)] == ["S2"]
+
+
+def test_connection_uses_wal_with_normal_sync(backend):
+    from nuvom.result_backends.sqlite_backend import _get_connection
+
+    conn = _get_connection(backend.db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
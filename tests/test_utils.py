@@ -6,3 +6,61 @@ def test_tomllib_import():
     from nuvom.utils.compat_utils.tomllib_compat import tomllib
     assert hasattr(tomllib, 'load')
     assert callable(tomllib.load)
+
+
+def test_json_compat_roundtrip():
+    from nuvom.utils.compat_utils.json_compat import dumps, dumps_pretty, loads
+
+    data = {"a": [1, 2, {"b": None}], "c": "ü"}
+    assert loads(dumps(data)) == data
+    assert loads(dumps_pretty(data)) == data
+    assert dumps_pretty({"a": 1}).splitlines()[1] == '  "a": 1'
+
+
+def test_ttl_cache_expiry_and_lru_eviction():
+    import time
+    from nuvom.utils.cache_utils.ttl_cache import TTLCache
+
+    cache = TTLCache(maxsize=2)
+    cache.set("a", None, ttl=60)
+    assert cache.get("a") is None            # cached None is a hit
+
+    cache.set("b", 2, ttl=60)
+    cache.get("a")                           # touch "a" → "b" is now LRU
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b", "miss") == "miss"
+
+    cache.set("d", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("d", "miss") == "miss"
+
+
+def test_result_store_cache_never_keeps_record_read_during_write(monkeypatch):
+    from nuvom import result_store
+
+    backend = result_store.get_backend()
+
+    # Read lands between the pre-write invalidation and the backend write
+    real_set_result = backend.set_result
+
+    def _set_result_after_read(*a, **kw):
+        assert result_store.get_outcome("job-1") == ("PENDING", None)
+        real_set_result(*a, **kw)
+
+    monkeypatch.setattr(backend, "set_result", _set_result_after_read)
+    result_store.set_result("job-1", "add", 3)
+    assert result_store.get_outcome("job-1") == ("SUCCESS", 3)
+
+    # Read fetches the old record, then the whole write completes before it caches
+    real_get_full = backend.get_full
+
+    def _get_full_then_write(job_id):
+        meta = real_get_full(job_id)
+        monkeypatch.setattr(backend, "get_full", real_get_full)
+        result_store.set_result(job_id, "add", 5)
+        return meta
+
+    monkeypatch.setattr(backend, "set_result", real_set_result)
+    monkeypatch.setattr(backend, "get_full", _get_full_then_write)
+    assert result_store.get_outcome("job-2") == ("PENDING", None)
+    assert result_store.get_outcome("job-2") == ("SUCCESS", 5)
@@ -0,0 +1,69 @@
+# tests/test_watcher.py
+
+import time
+from types import SimpleNamespace
+
+import nuvom.watcher as watcher
+from nuvom.watcher import ManifestChangeHandler
+
+
+def test_burst_of_events_triggers_single_reload(tmp_path, monkeypatch):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{}")
+
+    calls = []
+    monkeypatch.setattr(watcher, "auto_register_from_manifest", lambda: calls.append(1))
+
+    handler = ManifestChangeHandler(manifest, debounce_secs=0.05)
+    event = SimpleNamespace(src_path=str(manifest))
+    for _ in range(10):
+        handler.on_modified(event)
+
+    time.sleep(0.3)
+    assert calls == [1]
+
+
+def test_events_for_other_files_are_ignored(tmp_path, monkeypatch):
+    manifest = tmp_path / "manifest.json"
+    other = tmp_path / "other.json"
+
+    calls = []
+    monkeypatch.setattr(watcher, "auto_register_from_manifest", lambda: calls.append(1))
+
+    handler = ManifestChangeHandler(manifest, debounce_secs=0.01)
+    handler.on_modified(SimpleNamespace(src_path=str(other)))
+
+    time.sleep(0.1)
+    assert calls == []
+
+
+def test_event_during_slow_reload_waits_for_it(tmp_path, monkeypatch):
+    import threading
+
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{}")
+
+    started = threading.Event()
+    active, overlaps, calls = [], [], []
+
+    def _slow_reload():
+        if active:
+            overlaps.append(1)
+        active.append(1)
+        calls.append(1)
+        started.set()
+        time.sleep(0.3)
+        active.pop()
+
+    monkeypatch.setattr(watcher, "auto_register_from_manifest", _slow_reload)
+
+    handler = ManifestChangeHandler(manifest, debounce_secs=0.01)
+    event = SimpleNamespace(src_path=str(manifest))
+    handler.on_modified(event)
+    assert started.wait(1)
+
+    handler.on_modified(event)  # arrives while the first reload is running
+    time.sleep(0.9)
+
+    assert calls == [1, 1]  # the second change is still picked up
+    assert overlaps == []
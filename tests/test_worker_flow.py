@@ -71,3 +71,18 @@ def test_smart_worker_balancing():
         assert result == job.args[0] + job.args[1] or result == job.args[0] * job.args[1]
 
     print("[test] ✅ All jobs completed and returned correct results.")
+
+
+def test_job_runner_reuses_one_execution_thread_per_worker():
+    from nuvom.execution.job_runner import JobRunner
+
+    registry = get_task_registry()
+    registry.register("current_thread_name", lambda: threading.current_thread().name, force=True)
+
+    names = [
+        JobRunner(Job(func_name="current_thread_name", store_result=False), 0, 5).run().result
+        for _ in range(3)
+    ]
+
+    assert len(set(names)) == 1 and names[0].startswith("nuvom-job")
+    assert names[0] != threading.current_thread().name